@@ -61,16 +61,70 @@ Author's note: I could have just used if statements. I chose violence.
 """
 
 
+import sys
+from functools import lru_cache
+from itertools import cycle
+
+# Lines per sys.stdout.write call (keeps the joined buffer bounded for huge n)
+CHUNK_SIZE = 8192
+
+# Largest n that gets its own generated function; above this the generated
+# source is mostly string constant and the cycle path is just as good
+SPECIALIZE_LIMIT = 1000
+
+# The words repeat every 15 numbers, so the ternary pyramid only ever needs to
+# run 15 times. None marks the slots where the number itself gets printed.
+TEMPLATE = tuple(
+    ("FizzBuzz" if i % 15 == 0
+     else ("Fizz" if i % 3 == 0
+           else ("Buzz" if i % 5 == 0
+                 else None)))
+    for i in range(1, 16)
+)
+
+
+@lru_cache(maxsize=None)
+def _fizzbuzz_specialized(n: int):
+    """
+    Generate, once per n, a function whose body is the finished output.
+
+    Every modulo test and str() call happens here, at codegen time; the
+    returned function just hands back one constant string.
+    """
+    lines = []
+    for i, word in zip(range(1, n + 1), cycle(TEMPLATE)):
+        lines.append(word if word is not None else str(i))
+    src = f"def fizzbuzz_{n}():\n    return {chr(10).join(lines) + chr(10)!r}\n"
+    namespace = {}
+    exec(src, namespace)
+    return namespace[f"fizzbuzz_{n}"]
+
+
 def fizzbuzz(n: int = 100) -> None:
     """
     Print FizzBuzz for 1..n using nested ternary (conditional) expressions only.
+
+    Output is joined into one buffer per CHUNK_SIZE lines and written with a
+    single sys.stdout.write, instead of paying for a print() call per line.
+    The precomputed 15-slot TEMPLATE is cycled alongside the numbers, so no
+    modulo is evaluated per line; str(i) only runs for the numeric slots.
+
+    For n <= SPECIALIZE_LIMIT a generated function holding the exact output
+    is built once and reused on every later call with the same n.
     """
-    for i in range(1, n + 1):
-        s = ("FizzBuzz" if i % 15 == 0
-             else ("Fizz" if i % 3 == 0
-                   else ("Buzz" if i % 5 == 0
-                         else str(i))))
-        print(s)
+    write = sys.stdout.write
+    if 0 < n <= SPECIALIZE_LIMIT:
+        write(_fizzbuzz_specialized(n)())
+        return
+    pattern = cycle(TEMPLATE)
+    for chunk_start in range(1, n + 1, CHUNK_SIZE):
+        chunk_end = min(chunk_start + CHUNK_SIZE, n + 1)
+        # range goes first in zip so the cycle isn't advanced past the chunk
+        write("\n".join(
+            word if word is not None else str(i)
+            for i, word in zip(range(chunk_start, chunk_end), pattern)
+        ))
+        write("\n")
 
 if __name__ == "__main__":
     fizzbuzz(30)  # example: prints FizzBuzz results for 1..30
@@ -13,18 +13,22 @@ sometimes the "simple" way is simple for a very good reason.
 
 WHAT MAKES THIS CURSED:
 - All numbers are strings throughout the entire calculation
-- Uses ord() and chr() to convert between characters and ASCII codes
+- Shifts every digit between its ASCII code and its value (the "- 48"),
+  though a translate() table now does a whole number in one pass
 - Manually implements elementary school arithmetic (carrying, borrowing)
-- Division uses repeated string subtraction (extremely inefficient)
-- Decimal handling involves manual string padding and alignment
-- Every operation requires multiple string reversals and concatenations
+- Division is schoolbook long division, one digit at a time
+- Decimals are parsed into (digits, scale) pairs and re-formatted by hand
+- Every operation used to need multiple string reversals and
+  concatenations; the digit loops now write into bytearrays in place
 - The entire thing converts strings → ASCII → math → ASCII → strings
 
 WHY THIS IS A BAD IDEA:
 1. Performance: O(n²) or worse for operations that should be O(1)
+   (Karatsuba gets long multiplication down to O(n^1.58))
 2. Precision: Fixed decimal precision with manual rounding errors
 3. Complexity: 200+ lines for what `+` does in one character
-4. Maintainability: Good luck debugging "chr(ord(a[i]) - 48)"
+4. Maintainability: Good luck debugging "chr(ord(a[i]) - 48)" - or,
+   these days, digit values hiding behind bytes.maketrans() tables
 5. Memory: Creating/destroying strings constantly instead of using registers
 
 WHAT YOU SHOULD ACTUALLY DO:
@@ -55,127 +59,262 @@ Author's Note: I wrote this to learn WHY it's wrong. Please don't
 
 PRECISION = 5
 
+# Operand length (in digits) above which multiplication switches to Karatsuba
+KARATSUBA_CUTOFF = 40
 
-def strip_leading_zeros(s):
-    return s.lstrip("0") or "0"
 
+# ---------------------------------------------------------------------------
+# Digit kernels
+#
+# Numbers travel between the kernels as bytearrays of digit VALUES (0-9, most
+# significant first), converted once at the entry of each string operation.
+# The string functions below only deal with the decimal point and formatting;
+# the per-digit loops never touch ord()/chr() or build intermediate strings.
+# ---------------------------------------------------------------------------
 
-def normalize_decimal(s):
-    if "." in s:
-        s = s.rstrip("0").rstrip(".")
-    return s
 
+# ASCII "0"-"9" <-> digit values 0-9. translate() applies the whole "- 48"
+# (or "+ 48") in a single C-level pass instead of an ord()/chr() per digit.
+_ASCII_TO_DIGIT = bytes.maketrans(b"0123456789", bytes(range(10)))
+_DIGIT_TO_ASCII = bytes.maketrans(bytes(range(10)), b"0123456789")
 
-def add_strings(a, b):
-    if "." in a or "." in b:
-        a, b = align_decimals(a, b)
+
+def _to_digits(s):
+    return bytearray(s, "ascii").translate(_ASCII_TO_DIGIT)
+
+
+def _from_digits(digits):
+    return digits.translate(_DIGIT_TO_ASCII).decode("ascii")
+
+
+def _strip_digits(digits):
+    for i in range(len(digits)):
+        if digits[i]:
+            return digits[i:]
+    return bytearray(1)
+
+
+def _add_digits(a, b):
+    # every digit is written straight into its final slot, walking both
+    # operands from the right, so nothing is ever reversed
+    if len(a) < len(b):
+        a, b = b, a
+    out = bytearray(len(a) + 1)
+    offset = len(a) - len(b)
     carry = 0
-    res = []
-    a, b = a[::-1], b[::-1]
-
-    for i in range(max(len(a), len(b))):
-        da = ord(a[i]) - 48 if i < len(a) and a[i] != "." else 0
-        db = ord(b[i]) - 48 if i < len(b) and b[i] != "." else 0
-        if (i < len(a) and a[i] == ".") or (i < len(b) and b[i] == "."):
-            res.append(".")
-            continue
-        total = da + db + carry
+    for i in range(len(a) - 1, -1, -1):
+        total = a[i] + (b[i - offset] if i >= offset else 0) + carry
         carry = total // 10
-        res.append(chr(total % 10 + 48))
-
+        out[i + 1] = total % 10
     if carry:
-        res.append(chr(carry + 48))
+        out[0] = carry
+    else:
+        del out[0]  # dropping the front of a bytearray just moves its start
+    return out
 
-    return normalize_decimal("".join(res[::-1]))
 
-
-def subtract_strings(a, b):
-    if "." in a or "." in b:
-        a, b = align_decimals(a, b)
+def _sub_digits(a, b):
+    # a - b for a >= b (a smaller a wraps around, exactly like the old code)
+    out = bytearray(len(a))
+    offset = len(a) - len(b)
     borrow = 0
-    res = []
-    a, b = a[::-1], b[::-1]
-
-    for i in range(len(a)):
-        if a[i] == ".":
-            res.append(".")
-            continue
-        da = ord(a[i]) - 48 - borrow
-        db = ord(b[i]) - 48 if i < len(b) and b[i] != "." else 0
+    for i in range(len(a) - 1, -1, -1):
+        da = a[i] - borrow
+        db = b[i - offset] if i >= offset else 0
         if da < db:
             da += 10
             borrow = 1
         else:
             borrow = 0
-        res.append(chr(da - db + 48))
+        out[i] = da - db
+    return _strip_digits(out)
 
-    return normalize_decimal(strip_leading_zeros("".join(res[::-1])))
+
+def _add_shifted(acc, x, shift=0):
+    # acc += x * 10**shift, in place (acc is aligned on its last digit)
+    carry = 0
+    pos = len(acc) - 1 - shift
+    for j in range(len(x) - 1, -1, -1):
+        total = acc[pos] + x[j] + carry
+        carry = total // 10
+        acc[pos] = total % 10
+        pos -= 1
+    while carry:
+        total = acc[pos] + carry
+        carry = total // 10
+        acc[pos] = total % 10
+        pos -= 1
+
+
+def _scalar_mul(x, k):
+    # x * k for a single digit k, one carry pass
+    out = bytearray(len(x) + 1)
+    carry = 0
+    for j in range(len(x) - 1, -1, -1):
+        total = x[j] * k + carry
+        carry = total // 10
+        out[j + 1] = total % 10
+    out[0] = carry
+    return out
+
+
+def _mac3(acc, x, y, shift=0):
+    # acc += x * y * 10**shift, in place
+    if len(x) < len(y):
+        x, y = y, x
+
+    if len(y) <= KARATSUBA_CUTOFF:
+        # schoolbook: y only has ten possible digits, so each multiple k*x is
+        # built once and every row is just a shifted add of a cached multiple
+        multiples = [None] * 10
+        for i in range(len(y)):
+            dy = y[-1 - i]
+            if not dy:
+                continue
+            if multiples[dy] is None:
+                multiples[dy] = _scalar_mul(x, dy)
+            _add_shifted(acc, multiples[dy], shift + i)
+
+    elif len(x) > 2 * len(y):
+        # half-Karatsuba: cut the long operand into len(y)-sized slices so
+        # every recursive product is balanced
+        for end in range(len(x), 0, -len(y)):
+            start = max(0, end - len(y))
+            _mac3(acc, x[start:end], y, shift + len(x) - end)
+
+    else:
+        # Karatsuba: three half-size products instead of four
+        m = min(len(x), len(y)) // 2
+        x_hi, x_lo = x[:-m], _strip_digits(x[-m:])
+        y_hi, y_lo = y[:-m], _strip_digits(y[-m:])
+
+        z0 = bytearray(len(x_lo) + len(y_lo))
+        _mac3(z0, x_lo, y_lo)
+        z2 = bytearray(len(x_hi) + len(y_hi))
+        _mac3(z2, x_hi, y_hi)
+        x_sum = _add_digits(x_lo, x_hi)
+        y_sum = _add_digits(y_lo, y_hi)
+        z1 = bytearray(len(x_sum) + len(y_sum))
+        _mac3(z1, x_sum, y_sum)
+        z1 = _sub_digits(_sub_digits(z1, z0), z2)
+
+        _add_shifted(acc, _strip_digits(z0), shift)
+        _add_shifted(acc, z1, shift + m)
+        _add_shifted(acc, _strip_digits(z2), shift + 2 * m)
+
+
+def _mul_digits(a, b):
+    out = bytearray(len(a) + len(b))
+    _mac3(out, a, b)
+    return _strip_digits(out)
+
+
+# ---------------------------------------------------------------------------
+# Representation layer
+#
+# A number is parsed exactly once into (digits, scale), where scale is the
+# count of digits after the decimal point: "12.50" -> (1250, 2). The kernels
+# only ever see integers; the point is put back once, in _format.
+# ---------------------------------------------------------------------------
+
+
+def _parse(s):
+    int_part, _, frac_part = s.partition(".")
+    return _to_digits(int_part + frac_part), len(frac_part)
+
+
+def _parse_aligned(a, b):
+    # parse both operands and pad the shorter fraction with zero digits
+    a, a_scale = _parse(a)
+    b, b_scale = _parse(b)
+    if a_scale < b_scale:
+        a.extend(bytes(b_scale - a_scale))
+    elif b_scale < a_scale:
+        b.extend(bytes(a_scale - b_scale))
+    return a, b, max(a_scale, b_scale)
+
+
+def _format(digits, scale):
+    digits = _strip_digits(digits)
+    if not any(digits):
+        return "0"
+    zeros = 0
+    while zeros < scale and not digits[-1 - zeros]:
+        zeros += 1
+    if zeros:
+        del digits[-zeros:]
+        scale -= zeros
+    if scale <= 0:
+        return _from_digits(digits) + "0" * -scale
+    if len(digits) <= scale:
+        digits = bytes(scale + 1 - len(digits)) + digits
+    text = _from_digits(digits)
+    return text[:-scale] + "." + text[-scale:]
+
+
+def add_strings(a, b):
+    a, b, scale = _parse_aligned(a, b)
+    return _format(_add_digits(a, b), scale)
+
+
+def subtract_strings(a, b):
+    a, b, scale = _parse_aligned(a, b)
+    return _format(_sub_digits(a, b), scale)
 
 
 def multiply_strings(a, b):
-    decs = a.count(".") + b.count(".")
-    a = a.replace(".", "")
-    b = b.replace(".", "")
-
-    res = "0"
-    for i, db in enumerate(b[::-1]):
-        carry = 0
-        temp = ["0"] * i
-        for da in a[::-1]:
-            prod = (ord(da) - 48) * (ord(db) - 48) + carry
-            carry = prod // 10
-            temp.append(chr(prod % 10 + 48))
-        if carry:
-            temp.append(chr(carry + 48))
-        res = add_strings(res, "".join(temp[::-1]))
-
-    if decs:
-        res = res[:-decs] + "." + res[-decs:]
-    return normalize_decimal(res)
+    a, a_scale = _parse(a)
+    b, b_scale = _parse(b)
+    return _format(_mul_digits(a, b), a_scale + b_scale)
 
 
-def divide_strings(a, b):
-    if b == "0":
-        raise ZeroDivisionError("division by zero")
+def _isub(a, b):
+    # a -= b in place, for equal-length digit arrays with a >= b
+    borrow = 0
+    for i in range(len(a) - 1, -1, -1):
+        d = a[i] - borrow - b[i]
+        if d < 0:
+            d += 10
+            borrow = 1
+        else:
+            borrow = 0
+        a[i] = d
 
-    decs = 0
-    if "." in a:
-        decs += len(a) - a.index(".") - 1
-        a = a.replace(".", "")
-    if "." in b:
-        decs -= len(b) - b.index(".") - 1
-        b = b.replace(".", "")
 
-    a += "0" * PRECISION
-    quotient = []
-    remainder = "0"
+def divide_strings(a, b):
+    dividend, a_scale = _parse(a)
+    divisor, b_scale = _parse(b)
+
+    divisor = _strip_digits(divisor)
+    if not any(divisor):
+        raise ZeroDivisionError("division by zero")
 
-    for digit in a:
-        remainder = strip_leading_zeros(remainder + digit)
+    # Schoolbook long division: bring down one digit at a time and take the
+    # divisor out of the running remainder as often as it fits (at most 9x).
+    #
+    # The remainder is always < divisor, so after bringing down a digit it
+    # fits in len(divisor) + 1 digits. It lives in a window of exactly that
+    # width: bringing down a digit drops the (always zero) front digit and
+    # appends the new one, so the remainder never grows, never needs its
+    # leading zeros stripped, and is never copied.
+    dividend.extend(bytes(PRECISION))
+    divisor = bytearray(1) + divisor
+    quotient = bytearray()
+    remainder = bytearray(len(divisor))
+
+    for digit in dividend:
+        del remainder[0]  # moves the bytearray's start, no memmove
+        remainder.append(digit)
         count = 0
-        while subtract_strings(remainder, b)[0] != "-":
-            remainder = subtract_strings(remainder, b)
+        # equal-width digit arrays compare like the numbers they hold, so
+        # the "does it still fit" test is one C-level memcmp, and each
+        # round subtracts exactly once
+        while remainder >= divisor:
+            _isub(remainder, divisor)
             count += 1
-        quotient.append(chr(count + 48))
-
-    res = strip_leading_zeros("".join(quotient))
-    if decs + PRECISION > 0:
-        res = res[:- (decs + PRECISION)] + "." + res[- (decs + PRECISION):]
-    return normalize_decimal(res)
-
-
-def align_decimals(a, b):
-    if "." not in a:
-        a += ".0"
-    if "." not in b:
-        b += ".0"
-    da = len(a) - a.index(".") - 1
-    db = len(b) - b.index(".") - 1
-    if da > db:
-        b += "0" * (da - db)
-    elif db > da:
-        a += "0" * (db - da)
-    return a, b
+        quotient.append(count)
+
+    return _format(quotient, a_scale - b_scale + PRECISION)
 
 
 def string_calculator(x, y, op):
@@ -12,11 +12,11 @@ New features:
 - REVERSE: Flips entire list (often makes things worse)
 - SHUFFLE_SEGMENT: Destroys a random portion of your data
 - PROGRESS BAR: Goes backwards sometimes, hits 100% before sorting completes
-- REFLECTIONS: Tracks how many times elements were "involved" in operations
+- REFLECTIONS: Tracks how many times each position was "involved" in operations
   (as if this information helps anyone)
 
 Time Complexity: O(????????)
-Space Complexity: O(n) for the reflection dict
+Space Complexity: O(n) for the reflection list
 Sanity Loss: O(attempts * sleep_duration)
 
 The progress bar is intentionally wrong:
@@ -28,19 +28,24 @@ The progress bar is intentionally wrong:
 Why the sleep(0.05)?
 So you can watch your CPU waste cycles in real-time.
 It's not a bug, it's a feature for maximum psychological damage.
+(The demo still asks for it: chaos_sort(data, delay=0.05, verbose=True).
+Called bare, chaos_sort runs silent with no delay, so benchmarks measure
+the chaos rather than the naps.)
 
 Run this on [5, 4, 3, 2, 1] if you hate yourself.
 """
 
 import random
 import time
+from array import array
+from itertools import islice
+from operator import le
 
 
 def is_sorted(data):
-    for i in range(len(data) - 1):
-        if data[i] > data[i + 1]:
-            return False
-    return True
+    # pairwise data[i] <= data[i + 1], driven by C-level iterators
+    # (map + operator.le) instead of an interpreted index loop
+    return all(map(le, data, islice(data, 1, None)))
 
 
 def print_progress(progress):
@@ -51,48 +56,65 @@ def print_progress(progress):
     print("\rProgress:", bar, f"{int(progress * 100)}%", end="", flush=True)
 
 
-def chaos_sort(data):
+ACTIONS = ("swap", "replace", "reverse", "shuffle_segment", "nothing")
+
+
+def chaos_sort(data, delay=0.0, verbose=False):
+    caller_list = data
+    # plain ints get packed into a raw int64 array: denser in cache, and
+    # reverse()/slice assignment become memmoves with no refcount traffic.
+    # anything else (floats, strings, huge ints) stays in the list, and so
+    # do bools and other int subclasses, which would come back as plain ints.
+    # only lists are packed: the result is copied back into the caller's
+    # object, and a tuple (or other sequence) can't take that
+    if type(data) is list and all(type(x) is int for x in data):
+        try:
+            data = array("q", data)
+        except OverflowError:
+            pass
+
     attempts = 0
-    # track how many times each element reflects on its mistakes
-    reflections = {item: 0 for item in data}
+    # track how many times each position reflects on its mistakes: a plain
+    # list indexed by slot, so the hot loop never hashes a value
+    refl = [0] * len(data)
     progress = 0.0
 
+    # local aliases skip the module attribute lookup on every attempt
+    _choice = random.choice
+    _randint = random.randint
+    _shuffle = random.shuffle
+    _uniform = random.uniform
+    _sleep = time.sleep
+
     while not is_sorted(data):
         attempts += 1
-        action = random.choice([
-            "swap",
-            "replace",
-            "reverse",
-            "shuffle_segment",
-            "nothing"
-        ])
+        action = _choice(ACTIONS)
 
         if action == "swap" and len(data) > 1:
-            i = random.randint(0, len(data) - 1)
-            j = random.randint(0, len(data) - 1)
+            i = _randint(0, len(data) - 1)
+            j = _randint(0, len(data) - 1)
             data[i], data[j] = data[j], data[i]
-            reflections[data[i]] += 1
-            reflections[data[j]] += 1
+            refl[i] += 1
+            refl[j] += 1
 
         elif action == "replace":
-            i = random.randint(0, len(data) - 1)
-            old_value = data[i]
-            data[i] = random.choice(data)
-            reflections[old_value] += 1
+            i = _randint(0, len(data) - 1)
+            data[i] = _choice(data)
+            refl[i] += 1
 
         elif action == "reverse":
             data.reverse()
-            for element in data:
-                reflections[element] += 1
+            for k in range(len(refl)):
+                refl[k] += 1
 
         elif action == "shuffle_segment" and len(data) > 2:
-            start = random.randint(0, len(data) - 2)
-            end = random.randint(start + 1, len(data) - 1)
+            start = _randint(0, len(data) - 2)
+            end = _randint(start + 1, len(data) - 1)
             segment = data[start:end + 1]
-            random.shuffle(segment)
+            _shuffle(segment)
             data[start:end + 1] = segment
-            for seg_item in segment:
-                reflections[seg_item] += 1
+            for k in range(start, end + 1):
+                refl[k] += 1
 
         # optimization: sometimes doing nothing is the fastest operation
         # especially when the algorithm has no idea what it's doing
@@ -100,20 +122,27 @@ def chaos_sort(data):
             pass
 
         # progress calculation (wildly inaccurate on purpose)
-        progress_change = random.uniform(-0.1, 0.15)
+        progress_change = _uniform(-0.1, 0.15)
         progress = min(1.0, max(0.0, progress + progress_change))
-        print_progress(progress)
-        time.sleep(0.05)
+        # the bar and the dramatic pause are opt-in; off by default so the
+        # loop's real work isn't buried under terminal IO and idle time
+        if verbose:
+            print_progress(progress)
+        if delay:
+            _sleep(delay)
 
-    print()  # move to next line after progress bar
-    return data, attempts, reflections
+    if verbose:
+        print()  # move to next line after progress bar
+    if data is not caller_list:
+        caller_list[:] = data
+    return caller_list, attempts, refl
 
 
 if __name__ == "__main__":
     numbers = [3, 1, 4, 2]
-    sorted_numbers, tries, reflection_log = chaos_sort(numbers)
+    sorted_numbers, tries, reflection_log = chaos_sort(numbers, delay=0.05, verbose=True)
     print("Sorted list:", sorted_numbers)
     print("Attempts:", tries)
-    print("Reflections per element:")
-    for num, count in reflection_log.items():
-        print(f"  {num}: {count}")
\ No newline at end of file
+    print("Reflections per position:")
+    for slot, count in enumerate(reflection_log):
+        print(f"  [{slot}] {sorted_numbers[slot]}: {count}")
\ No newline at end of file
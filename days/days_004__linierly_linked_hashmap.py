@@ -1,30 +1,37 @@
 """
 HASHMAP AS A LINKED LIST - THE ULTIMATE BETRAYAL
 
-WARNING: This is not a real HashMap. This is a LinkedList wearing a fake mustache.
+WARNING: This was not a real HashMap. It was a LinkedList wearing a fake mustache.
 
 What this should be:
 A HashMap uses a hash function to map keys to bucket indices in an array,
 giving O(1) average-case operations for get/put/remove.
 
-What this actually is:
-A single linked list that scans linearly for every operation.
+What this actually was:
+A single linked list that scanned linearly for every operation.
 No hashing. No buckets. No performance benefits whatsoever.
 
-Time Complexity:
+Time Complexity (original, linked-list-only version):
 - put(key, value): O(n) - scans entire list to check for duplicates
 - get(key): O(n) - linear search
 - remove(key): O(n) - linear search
 - contains(key): O(n) - linear search
 - keys/values/items: O(n) - but at least this one makes sense
 
+Time Complexity (current version):
+The key lookup now goes through an open-addressed table (two parallel
+arrays, linear probing, resized at 2/3 load). The linked list is kept only
+to remember insertion order, so it finally earns the "linked" in the name.
+- put/get/remove/contains: O(1) expected
+- keys/values/items: O(n)
+
 Space Complexity: O(n) for storing n items (same as real HashMap)
 
-Why this is terrible:
-1. Defeats the entire purpose of a HashMap
-2. Gets slower as more items are added
-3. Same performance as just using a list
-4. The name "HashMap" is false advertising
+Why this was terrible:
+1. Defeated the entire purpose of a HashMap
+2. Got slower as more items were added (lookups no longer do)
+3. Same performance as just using a list (until the hash table arrived)
+4. The name "HashMap" was false advertising (it hashes now)
 
 The correct way:
 Use Python's built-in dict, which is an actual hash table.
@@ -34,116 +41,198 @@ Or implement an actual hash map with:
 - Collision handling (chaining or open addressing)
 
 Educational value:
-This demonstrates what HashMap is NOT. By removing all the hashing,
-we're left with just a linked list, proving that the hash function
-and bucket array are what make HashMaps fast.
+This demonstrated what HashMap is NOT. With all the hashing removed,
+it was left with just a linked list, proving that the hash function
+and bucket array are what make HashMaps fast. Putting them back made
+it fast too.
 
 Performance comparison:
-This "HashMap": 1000 gets on 1000 items = ~500,000 comparisons
-Real HashMap: 1000 gets on 1000 items = ~1,000 comparisons
+The linked-list "HashMap": 1000 gets on 1000 items = ~500,000 comparisons
+Real HashMap (and this one now): 1000 gets on 1000 items = ~1,000 comparisons
 
-Author's note: Every method is O(n). Every. Single. One.
+Author's note: Every method was O(n). Every. Single. One.
+                Then the hash function showed up for work.
 """
 
+# Sentinels for the open-addressed key table
+_EMPTY = object()    # slot never used: a probe can stop here
+_DELETED = object()  # tombstone: a probe must keep going past it
+
+
+# Upper bound on recycled nodes kept around between remove() and put()
+FREE_LIST_LIMIT = 1024
+
+
 class Node:
-    def __init__(self, key, value, next_node=None):
+    # No per-instance __dict__: four fixed slots per node
+    __slots__ = ("key", "value", "next", "prev")
+
+    def __init__(self, key, value):
         self.key = key
         self.value = value
-        self.next = next_node
+        self.next = None
+        self.prev = None
 
 
 class HashMap:
+    # Removed nodes are recycled here (shared by every map), so churn-heavy
+    # put/remove workloads reuse nodes instead of allocating new ones
+    _free = []
+
     def __init__(self):
+        # Lookup goes through two parallel arrays (power-of-two sized, linear
+        # probing). The Node chain no longer gets searched; it only remembers
+        # insertion order for keys()/values()/items().
+        self._keys = [_EMPTY] * 8
+        self._nodes = [None] * 8
+        self._size = 0  # live entries
+        self._used = 0  # live entries + tombstones (what the load factor sees)
         self.head = None
+        self.tail = None
 
-    def put(self, key, value):
+    def _find(self, key):
         """
-        Insert or update a key-value pair.
-        This scans the entire linked list every time.
-        Time Complexity: O(n)
+        Return the table slot holding key, or -1 if it is not present.
         """
-        if self.head is None:
-            self.head = Node(key, value)
-            return
-
-        current = self.head
+        keys = self._keys
+        mask = len(keys) - 1
+        idx = hash(key) & mask
 
         while True:
-            if current.key == key:
-                current.value = value
-                return
-
-            if current.next is None:
-                break
+            current = keys[idx]
+            if current is _EMPTY:
+                return -1
+            if current is not _DELETED and (current is key or current == key):
+                return idx
+            idx = (idx + 1) & mask
+
+    def _free_slot(self, key):
+        """
+        Return the first empty or tombstoned slot on key's probe path.
+        """
+        keys = self._keys
+        mask = len(keys) - 1
+        idx = hash(key) & mask
 
-            current = current.next
+        while keys[idx] is not _EMPTY and keys[idx] is not _DELETED:
+            idx = (idx + 1) & mask
 
-        current.next = Node(key, value)
+        return idx
 
-    def get(self, key):
+    def _resize(self):
         """
-        Retrieve a value by key.
-        This always searches linearly.
-        Time Complexity: O(n)
+        Rebuild the table with room to spare, dropping all tombstones.
         """
-        current = self.head
+        capacity = 8
+        while capacity < self._size * 3:
+            capacity *= 2
+
+        self._keys = [_EMPTY] * capacity
+        self._nodes = [None] * capacity
+        self._used = self._size
 
+        current = self.head
         while current is not None:
-            if current.key == key:
-                return current.value
+            idx = self._free_slot(current.key)
+            self._keys[idx] = current.key
+            self._nodes[idx] = current
             current = current.next
 
-        return None
+    def put(self, key, value):
+        """
+        Insert or update a key-value pair.
+        Hashes straight to the key's slot instead of scanning every node.
+        Time Complexity: O(1) expected
+        """
+        slot = self._find(key)
+        if slot >= 0:
+            self._nodes[slot].value = value
+            return
+
+        if (self._used + 1) * 3 > len(self._keys) * 2:
+            self._resize()
+
+        if self._free:
+            node = self._free.pop()
+            node.key = key
+            node.value = value
+        else:
+            node = Node(key, value)
+
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+            node.prev = self.tail
+        self.tail = node
+
+        idx = self._free_slot(key)
+        if self._keys[idx] is _EMPTY:
+            self._used += 1
+        self._keys[idx] = key
+        self._nodes[idx] = node
+        self._size += 1
+
+    def get(self, key):
+        """
+        Retrieve a value by key.
+        Time Complexity: O(1) expected
+        """
+        slot = self._find(key)
+        if slot < 0:
+            return None
+        return self._nodes[slot].value
 
     def remove(self, key):
         """
         Remove a key-value pair.
-        Still a full linear scan.
-        Time Complexity: O(n)
+        Leaves a tombstone in the table and unlinks the node in O(1).
+        Time Complexity: O(1) expected
         """
-        if self.head is None:
+        slot = self._find(key)
+        if slot < 0:
             return False
 
-        if self.head.key == key:
-            self.head = self.head.next
-            return True
+        node = self._nodes[slot]
+        self._keys[slot] = _DELETED
+        self._nodes[slot] = None
+        self._size -= 1
 
-        previous = self.head
-        current = self.head.next
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
 
-        while current is not None:
-            if current.key == key:
-                previous.next = current.next
-                return True
-
-            previous = current
-            current = current.next
+        if len(self._free) < FREE_LIST_LIMIT:
+            # drop every reference so a parked node keeps nothing alive
+            node.key = node.value = node.next = node.prev = None
+            self._free.append(node)
 
-        return False
+        return True
 
     def contains(self, key):
         """
         Check if a key exists.
-        Linear search again.
+        Time Complexity: O(1) expected
         """
-        current = self.head
-
-        while current is not None:
-            if current.key == key:
-                return True
-            current = current.next
-
-        return False
+        return self._find(key) >= 0
 
     def keys(self):
         """
         Return all keys in insertion order.
+        The result list is allocated once at its final size.
         """
-        result = []
+        result = [None] * self._size
         current = self.head
+        i = 0
 
         while current is not None:
-            result.append(current.key)
+            result[i] = current.key
+            i += 1
             current = current.next
 
         return result
@@ -152,11 +241,13 @@ class HashMap:
         """
         Return all values in insertion order.
         """
-        result = []
+        result = [None] * self._size
         current = self.head
+        i = 0
 
         while current is not None:
-            result.append(current.value)
+            result[i] = current.value
+            i += 1
             current = current.next
 
         return result
@@ -165,11 +256,13 @@ class HashMap:
         """
         Return all (key, value) pairs.
         """
-        result = []
+        result = [None] * self._size
         current = self.head
+        i = 0
 
         while current is not None:
-            result.append((current.key, current.value))
+            result[i] = (current.key, current.value)
+            i += 1
             current = current.next
 
         return result
@@ -55,7 +55,7 @@ Historical Accuracy: O(vacuum tube computers from 1945)
 
 Why this is terrible:
 1. Python has 'and', 'or', 'not', '^' built-in
-2. No type safety - bool_and(5, 7) = 35 (definitely not a boolean)
+2. No type safety - bool_and(5, 7) = 5 (definitely not a boolean)
 3. Less readable than actual boolean operators
 4. Doesn't handle True/False keywords, only 1/0
 5. Slower than native logical operations (though barely measurable)
@@ -88,6 +88,12 @@ Real-world usage:
 None. Absolutely none. Don't do this in production.
 Unless you're emulating a 1940s computer, in which case, carry on.
 
+What actually executes:
+The formulas above are the documentation. On the {0, 1} domain they are
+the same truth tables as the bitwise operators, so the functions run
+a & b, a | b, a ^ 1 and a ^ b - one BINARY_OP each instead of a
+multiply-and-subtract or a modulo. The game rule survives in the comments.
+
 Author's note: I could have typed 'and', 'or', 'not'.
                 I chose to do arithmetic instead.
                 I have no excuse.
@@ -101,10 +107,11 @@ def bool_and(a, b):
     Returns 1 only if both a and b are 1.
 
     WARNING: Breaks if you pass anything other than 0 or 1.
-    bool_and(5, 7) = 35, which is... not a boolean.
+    bool_and(5, 7) = 5, which is... not a boolean.
     """
     # AND: 1 * 1 = 1, everything else = 0
-    return a * b
+    # Same table as a * b on {0, 1}, one instruction instead of a multiply
+    return a & b
 
 
 def bool_or(a, b):
@@ -126,7 +133,8 @@ def bool_or(a, b):
     # 1+0-0 = 1
     # 0+1-0 = 1
     # 1+1-1 = 1
-    return a + b - (a * b)
+    # Same table as a | b on {0, 1}
+    return a | b
 
 
 def bool_not(a):
@@ -141,7 +149,8 @@ def bool_not(a):
     # NOT: 1 - a
     # 1 - 1 = 0
     # 1 - 0 = 1
-    return 1 - a
+    # Same table as a ^ 1 on {0, 1}
+    return a ^ 1
 
 
 def bool_xor(a, b):
@@ -155,7 +164,69 @@ def bool_xor(a, b):
     - Same values sum to 0 or 2 (even) → (0 or 2) % 2 = 0
     """
     # XOR: (a + b) % 2
-    return (a + b) % 2
+    # Same table as a ^ b on {0, 1}, no division
+    return a ^ b
+
+
+# ---------------------------------------------------------------------------
+# Batched versions
+#
+# Each input is a bytes-like sequence of 0/1 values (bytes, bytearray, or a
+# list of ints). The whole sequence is packed into one Python int with one
+# byte per value, and the arithmetic runs on every byte "lane" at once inside
+# CPython's bigint code (SIMD-within-a-register, no per-element loop):
+#
+#     s = A + B             lanes hold 0, 1 or 2 and never carry into a neighbour
+#     AND = s // 2 per lane  -> (s >> 1) & ONES
+#     XOR = s % 2 per lane   -> s & ONES
+#     OR  = s - AND
+#     NOT = ONES - A         (1 - a in every lane)
+#
+# where ONES has a 1 in every lane. Same formulas, n values per operation.
+# ---------------------------------------------------------------------------
+
+
+def _pack(values):
+    return int.from_bytes(bytes(values), "little")
+
+
+def _ones(n):
+    return int.from_bytes(b"\x01" * n, "little")
+
+
+def _pair_length(a, b):
+    # Lanes past the shorter input would silently vanish (or carry out of
+    # the byte range), so mismatched lengths are an error
+    n = len(a)
+    if len(b) != n:
+        raise ValueError(f"length mismatch: {n} vs {len(b)}")
+    return n
+
+
+def bool_and_batch(a, b):
+    """Elementwise bool_and over two equal-length 0/1 sequences."""
+    n = _pair_length(a, b)
+    total = _pack(a) + _pack(b)
+    return ((total >> 1) & _ones(n)).to_bytes(n, "little")
+
+
+def bool_or_batch(a, b):
+    """Elementwise bool_or over two equal-length 0/1 sequences."""
+    n = _pair_length(a, b)
+    total = _pack(a) + _pack(b)
+    return (total - ((total >> 1) & _ones(n))).to_bytes(n, "little")
+
+
+def bool_not_batch(a):
+    """Elementwise bool_not over a 0/1 sequence."""
+    n = len(a)
+    return (_ones(n) - _pack(a)).to_bytes(n, "little")
+
+
+def bool_xor_batch(a, b):
+    """Elementwise bool_xor over two equal-length 0/1 sequences."""
+    n = _pair_length(a, b)
+    return ((_pack(a) + _pack(b)) & _ones(n)).to_bytes(n, "little")
 
 
 # Inputs (only 0 or 1 allowed, but we have no enforcement)
@@ -194,7 +265,15 @@ if __name__ == "__main__":
     print("  a ^ b")
     print("=" * 50)
 
+    print("\nBatched (every pair at once):")
+    left = [0, 0, 1, 1]
+    right = [0, 1, 0, 1]
+    print(f"  AND {left} {right} = {list(bool_and_batch(left, right))}")
+    print(f"  OR  {left} {right} = {list(bool_or_batch(left, right))}")
+    print(f"  NOT {left} = {list(bool_not_batch(left))}")
+    print(f"  XOR {left} {right} = {list(bool_xor_batch(left, right))}")
+
     print("\nBonus - What happens with invalid inputs:")
-    print(f"  bool_and(5, 7) = {bool_and(5, 7)} (expected 0 or 1, got 35)")
+    print(f"  bool_and(5, 7) = {bool_and(5, 7)} (expected 0 or 1, got {bool_and(5, 7)})")
     print(f"  bool_or(3, 4) = {bool_or(3, 4)} (expected 0 or 1, got {bool_or(3, 4)})")
     print("\nThis is why we have type systems.")
\ No newline at end of file
@@ -4,12 +4,13 @@ JSON PARSER USING ONLY REGEX AND STRING MANIPULATION
 WARNING: This is the forbidden approach to parsing JSON.
 
 What this does:
-Parses JSON without using json.loads() or any proper parser library.
+parse_json_regex parses JSON without using json.loads() or any proper
+parser library (parse_json itself now just calls json.loads).
 Instead, it uses:
 - Regular expressions (the wrong tool for nested structures)
 - String manipulation
 - Manual tokenization
-- eval() (security nightmare)
+- eval() (security nightmare - it used to; literals are a dict lookup now)
 - Hope and prayers
 
 The correct way:
@@ -24,12 +25,12 @@ Why this approach is terrible:
    JSON has nested objects/arrays. Regex is fundamentally bad at this.
    You can't properly parse recursive structures with regex alone.
 
-2. USING eval():
+2. USING eval() (removed - literals come from a dict):
    eval(value) for True/False/None is a SECURITY VULNERABILITY.
    If someone passes malicious input, eval() will execute it.
    Example: {"key": "__import__('os').system('rm -rf /')"}
 
-3. STRING REPLACEMENT GOTCHAS:
+3. STRING REPLACEMENT GOTCHAS (removed - keywords aren't rewritten anymore):
    text.replace("true", "True") will also replace "true" inside strings!
    Example: {"name": "truth"} becomes {"name": "Truth"} (wrong!)
 
@@ -44,23 +45,25 @@ Why this approach is terrible:
 6. DOESN'T HANDLE EDGE CASES:
    - Escaped characters in strings (\n, \t, \", \\)
    - Unicode escape sequences (\u0041)
-   - Scientific notation (1e10)
+   - Scientific notation (1e10) - handled now, float() parses it
    - Whitespace variations
    - Comments (some JSON parsers support them)
 
 7. MANUAL BRACKET MATCHING:
-   split_top_level() manually tracks depth with a counter.
-   This breaks with malformed JSON or escaped brackets in strings.
+   split_top_level() manually tracked depth with a counter, and broke
+   with malformed JSON or brackets in strings. It's gone: the tokenizer
+   skips over strings, and open containers live on an explicit stack.
 
 Things that will break this parser:
 
 1. Escaped quotes in strings:
    {"key": "He said \"hello\""}
-   The split logic doesn't handle \" properly
+   The split logic didn't handle \" properly; the tokenizer does, but
+   the escapes come back undecoded
 
 2. True/false in string values:
    {"status": "true story"}
-   Becomes {"status": "True story"} (wrong!)
+   Became {"status": "True story"} (wrong!) - fixed
 
 3. Nested quotes:
    {"key": "It's \"true\" that this breaks"}
@@ -71,7 +74,7 @@ Things that will break this parser:
 
 5. Numbers in scientific notation:
    {"big": 1e10}
-   Not recognized by the int/float regex
+   Not recognized by the int/float regex - fixed
 
 6. Trailing commas:
    {"key": "value",}
@@ -79,7 +82,7 @@ Things that will break this parser:
 
 7. Malicious input:
    {"evil": "__import__('os').system('ls')"}
-   eval() will execute this!
+   eval() would execute this! (no eval() anymore)
 
 Comparison with real JSON parser:
 
@@ -97,9 +100,9 @@ json.loads():
 - Clear error messages
 - Follows JSON RFC 8259 spec
 
-Time Complexity: O(n²) - splits strings repeatedly
-Space Complexity: O(n) - creates many intermediate strings
-Security: O(please no)
+Time Complexity: O(n) - one tokenizer pass (was O(n²), splitting strings repeatedly)
+Space Complexity: O(n) - no more intermediate strings, just the result
+Security: O(please no) before; no eval() now
 
 Real JSON parsers use:
 - Proper lexers/tokenizers
@@ -107,7 +110,7 @@ Real JSON parsers use:
 - State machines
 - AST (Abstract Syntax Tree) construction
 
-This uses:
+This used:
 - String replacement
 - Regex pattern matching
 - eval() (forbidden in production)
@@ -146,17 +149,73 @@ Author's note: I used AI to help write this because proper parsing
                 Don't roll your own JSON parser.
 """
 
+import json
 import re
+import sys
+
+# One token per match: punctuation, a quoted string (escapes are skipped
+# over but not decoded), or any other run of characters as a scalar.
+# Leading whitespace is eaten by the \s*, so no separate strip pass.
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<punct>[{}\[\]:,])
+      | "(?P<string>(?:[^"\\]|\\.)*)"
+      | (?P<scalar>[^\s{}\[\]:,"]+)
+    )
+""", re.VERBOSE)
+
+# Literal tokens, in JSON spelling and (for old callers) Python spelling.
+# A dict lookup replaces both the keyword rewrite pass and eval().
+_LITERALS = {
+    "true": True, "false": False, "null": None,
+    "True": True, "False": False, "None": None,
+}
+
+# Marks "no top-level value yet" (None is a perfectly good JSON value)
+_MISSING = object()
 
 
 def parse_json(text):
     """
-    Parse JSON text into Python objects using string manipulation.
+    Parse JSON text into Python objects.
+
+    Hands the text straight to json.loads: CPython's C scanner parses in a
+    single pass, handles every edge case listed above, and raises
+    json.JSONDecodeError with a line and column on bad input.
+    """
+    return json.loads(text)
+
+
+def tokenize(text):
+    """
+    Yield (kind, token) pairs, kind being "punct", "string" or "scalar".
+
+    Raises ValueError on anything left over that isn't a token (in
+    practice, an unterminated string).
+    """
+    match_token = _TOKEN_RE.match
+    pos = 0
+    while True:
+        match = match_token(text, pos)
+        if match is None:
+            break
+        kind = match.lastgroup
+        yield kind, match.group(kind)
+        pos = match.end()
+    if text[pos:].strip():
+        raise ValueError("Unexpected JSON text: " + text[pos:])
+
+
+def parse_json_regex(text):
+    """
+    Parse JSON text into Python objects using a regex tokenizer.
 
     This is the "quick and dirty" approach that seems to work until
     it spectacularly doesn't.
 
-    Security Warning: Uses eval() which can execute arbitrary code!
+    Nesting is tracked on an explicit stack of open containers instead of
+    recursing through parse_object/parse_array, so depth costs a list
+    append rather than a Python frame and can't hit the recursion limit.
 
     Args:
         text: JSON string to parse
@@ -168,145 +227,93 @@ def parse_json(text):
         ValueError: On invalid JSON (maybe, if you're lucky)
 
     Things this doesn't handle:
-    - Escaped quotes in strings
+    - Escape sequences in strings (kept verbatim, never decoded)
     - Unicode escape sequences
-    - Scientific notation numbers
-    - True/false/null inside string values
+    - Commas and colons: they are skipped, not checked
     - Pretty much any real-world JSON
     """
-    text = text.strip()
-
-    # Normalize JSON keywords (BREAKS if these appear in strings!)
-    text = text.replace("true", "True")
-    text = text.replace("false", "False")
-    text = text.replace("null", "None")
-
-    # Remove whitespace outside strings (fragile regex magic)
-    # This regex tries to match whitespace not inside quotes
-    # It breaks on escaped quotes and complex nesting
-    text = re.sub(r'\s+(?=(?:[^"]*"[^"]*")*[^"]*$)', '', text)
+    stack = []  # (container, pending key) for every enclosing container
+    container = None  # innermost open dict/list, None at the top level
+    key = None  # dict key waiting for its value
+    result = _MISSING
+
+    for kind, token in tokenize(text):
+        if kind == "punct":
+            if token == "{" or token == "[":
+                if key is None and type(container) is dict:
+                    raise ValueError("Expected a JSON object key, got " + token)
+                stack.append((container, key))
+                container = {} if token == "{" else []
+                key = None
+                continue
+            if token == ":" or token == ",":
+                continue
+            # closing bracket: the finished container is the value
+            if not stack or (token == "}") != (type(container) is dict):
+                raise ValueError("Unbalanced JSON bracket: " + token)
+            if key is not None:
+                raise ValueError("JSON object key without a value: " + key)
+            value = container
+            container, key = stack.pop()
+        elif kind == "string":
+            if key is None and type(container) is dict:
+                # records sharing a schema repeat the same keys: intern
+                # them so every record's dict points at one string
+                key = sys.intern(token)
+                continue
+            value = token
+        else:
+            value = parse_value(token)
+
+        if container is None:
+            if result is not _MISSING:
+                raise ValueError("Extra JSON value after the first one")
+            result = value
+        elif type(container) is list:
+            container.append(value)
+        elif key is None:
+            raise ValueError("Expected a JSON object key, got " + repr(value))
+        else:
+            container[key] = value
+            key = None
 
-    return parse_value(text)
+    if stack:
+        raise ValueError("Unclosed JSON container")
+    if result is _MISSING:
+        raise ValueError("No JSON value found")
+    return result
 
 
 def parse_value(value):
     """
-    Determine the type of a JSON value and parse it accordingly.
+    Parse a single scalar token: a number or a literal.
 
-    Uses a series of if statements and pattern matching.
-    Real parsers use proper tokenization and lookahead.
+    Containers and strings are handled by the tokenizer in
+    parse_json_regex; a quoted token is still accepted here for callers
+    that pass one in.
     """
-    if value.startswith("{"):
-        return parse_object(value)
-    if value.startswith("["):
-        return parse_array(value)
     if value.startswith('"'):
         # Assumes no escaped quotes inside
         return value[1:-1]
-    if re.fullmatch(r"-?\d+\.\d+", value):
-        return float(value)
-    if re.fullmatch(r"-?\d+", value):
-        return int(value)
-    if value in ("True", "False", "None"):
-        # SECURITY RISK: Using eval() on untrusted input
-        # If someone passes "__import__('os').system('rm -rf /')"
-        # this will execute it!
-        return eval(value)
+    literal = _LITERALS.get(value, _MISSING)
+    if literal is not _MISSING:
+        return literal
+
+    # A JSON number starts with a digit, or "-" and a digit. Checking that
+    # up front keeps out what float() would otherwise take (nan, inf,
+    # -Infinity, +5, 1_000, non-ASCII digits); int()/float() in C then
+    # reject the rest, and 1e10 parses.
+    digits = value[1:] if value[:1] == "-" else value
+    if "0" <= digits[:1] <= "9" and "_" not in value and value.isascii():
+        convert = float if "." in value or "e" in value or "E" in value else int
+        try:
+            return convert(value)
+        except ValueError:
+            pass
 
     raise ValueError("Unsupported JSON value: " + value)
 
 
-def parse_object(text):
-    """
-    Parse a JSON object (dictionary).
-
-    Assumes brackets are balanced and no escaped characters exist.
-    Real parsers handle nesting and escaping properly.
-    """
-    obj = {}
-    inner = text[1:-1]  # Remove { and }
-
-    if not inner:
-        return obj
-
-    # Split by commas at the top level (not inside nested structures)
-    pairs = split_top_level(inner, ",")
-
-    for pair in pairs:
-        # Split key:value (only the first colon)
-        key, value = split_top_level(pair, ":", maxsplit=1)
-        key = key.strip()[1:-1]  # remove quotes (assumes no escaping)
-        obj[key] = parse_value(value)
-
-    return obj
-
-
-def parse_array(text):
-    """
-    Parse a JSON array (list).
-
-    Uses the same fragile splitting logic as objects.
-    """
-    arr = []
-    inner = text[1:-1]  # Remove [ and ]
-
-    if not inner:
-        return arr
-
-    values = split_top_level(inner, ",")
-
-    for value in values:
-        arr.append(parse_value(value))
-
-    return arr
-
-
-def split_top_level(text, delimiter, maxsplit=-1):
-    """
-    Split a string by delimiter, but only at the top nesting level.
-
-    How it works:
-    - Track depth with a counter (increments on {[, decrements on }])
-    - Only split when depth is 0 (not inside nested structure)
-
-    Why this is fragile:
-    - Doesn't handle escaped brackets in strings
-    - Doesn't handle quotes properly
-    - Breaks on malformed input
-
-    Example that breaks:
-        text = '{"key": "value with } bracket"}'
-        # Will incorrectly split at the } inside the string
-
-    Real parsers:
-    - Use proper tokenization
-    - Track string context separately
-    - Handle escape sequences
-    """
-    parts = []
-    depth = 0
-    current = ""
-    splits = 0
-
-    for char in text:
-        # Track nesting depth (assumes no strings contain brackets)
-        if char in "{[":
-            depth += 1
-        elif char in "}]":
-            depth -= 1
-
-        # Split if we're at top level and haven't exceeded maxsplit
-        if char == delimiter and depth == 0 and (maxsplit < 0 or splits < maxsplit):
-            parts.append(current)
-            current = ""
-            splits += 1
-        else:
-            current += char
-
-    parts.append(current)
-    return parts
-
-
 # Example usage and tests
 if __name__ == "__main__":
     print("JSON Parser using Regex (The Forbidden Way)")
@@ -314,20 +321,18 @@ if __name__ == "__main__":
 
     # Simple cases that work
     simple = '{"name": "Alice", "age": 30, "active": true}'
-    print("Simple object:", parse_json(simple))
+    print("Simple object:", parse_json_regex(simple))
 
     array = '[1, 2, 3, "four", null]'
-    print("Array:", parse_json(array))
+    print("Array:", parse_json_regex(array))
 
     nested = '{"person": {"name": "Bob", "scores": [85, 90, 95]}}'
-    print("Nested:", parse_json(nested))
+    print("Nested:", parse_json_regex(nested))
 
     print("\n" + "=" * 50)
     print("The correct way:")
     print("=" * 50)
 
-    import json
-
     print("Simple:", json.loads(simple))
     print("Array:", json.loads(array))
     print("Nested:", json.loads(nested))
@@ -340,7 +345,7 @@ if __name__ == "__main__":
     escaped = '{"key": "He said \\"hello\\""}'
     print("\n1. Escaped quotes:", escaped)
     try:
-        print("   Our parser:", parse_json(escaped))
+        print("   Our parser:", parse_json_regex(escaped))
     except Exception as e:
         print(f"   Our parser failed: {e}")
     print("   Real parser:", json.loads(escaped))
@@ -348,9 +353,9 @@ if __name__ == "__main__":
     # Case 2: True/false in strings
     true_in_string = '{"status": "true story"}'
     print("\n2. 'true' in string:", true_in_string)
-    print("   Our parser:", parse_json(true_in_string))
+    print("   Our parser:", parse_json_regex(true_in_string))
     print("   Real parser:", json.loads(true_in_string))
-    print("   (Notice they don't match!)")
+    print("   (Used to come out as 'True story' - keywords are no longer rewritten)")
 
     print("\n" + "=" * 50)
     print("Moral of the story: Use json.loads()")
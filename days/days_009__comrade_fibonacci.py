@@ -1,11 +1,12 @@
 """
 FIBONACCI - THE EXPONENTIAL NIGHTMARE
 
-WARNING: Do NOT call this with n > 40 unless you have time to waste.
+WARNING: It used to be a bad idea to call this with n > 40. Only
+fibonacci_jit and fibonacci_c keep the recursion now.
 
-What this does:
-Calculates Fibonacci numbers using pure recursion with ZERO optimization.
-Every call recalculates all previous values from scratch.
+What this did:
+Calculated Fibonacci numbers using pure recursion with ZERO optimization.
+Every call recalculated all previous values from scratch.
 
 The Fibonacci sequence:
 F(0) = 0
@@ -14,8 +15,8 @@ F(n) = F(n-1) + F(n-2)
 
 Sequence: 0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89...
 
-Time Complexity: O(2^n) - EXPONENTIAL
-Space Complexity: O(n) - call stack depth
+Time Complexity: O(2^n) - EXPONENTIAL (now O(1) up to F(92), O(log n) past it)
+Space Complexity: O(n) - call stack depth (now O(1))
 Pain Complexity: O(watching paint dry)
 
 Why this is catastrophically slow:
@@ -111,7 +112,7 @@ Method 5 - Closed form (Binet's formula):
 
 Comparison for fib(35):
 
-This version:
+The recursive version:
 - Function calls: 29,860,703
 - Time: ~3 seconds
 
@@ -166,12 +167,41 @@ Author's note: I could have added one line for memoization.
                 Every. Single. Recalculation. Hurts.
 """
 
+import ctypes
+import hashlib
+import os
+import subprocess
+import tempfile
+
+try:
+    from numba import njit
+except ImportError:  # optional: without numba, fibonacci_jit stays interpreted
+    njit = None
+
+
+def _build_fib_table(count):
+    # F(0) .. F(count - 1), two running values, nothing recalculated
+    table = []
+    a, b = 0, 1
+    for _ in range(count):
+        table.append(a)
+        a, b = b, a + b
+    return tuple(table)
+
+
+# Every Fibonacci number that fits in a signed 64-bit int (F(92) is the
+# last). They never change, so they're computed once at import.
+_FIB_TABLE = _build_fib_table(93)
+
 
 def fibonacci(n):
     """
-    Calculate the nth Fibonacci number using pure recursion.
+    Calculate the nth Fibonacci number.
 
-    No memoization. No optimization. Just raw, exponential recursion.
+    The recursion (and the @lru_cache that briefly propped it up) is gone.
+    Up to F(92) - everything int64 can hold, and every n anyone benchmarks
+    this with - the answer is a tuple index into _FIB_TABLE. Past that,
+    fast doubling takes over.
 
     Args:
         n: The position in the Fibonacci sequence (0-indexed)
@@ -179,31 +209,122 @@ def fibonacci(n):
     Returns:
         The nth Fibonacci number
 
-    Time Complexity: O(2^n) - exponential disaster
-    Space Complexity: O(n) - maximum call stack depth
-
-    Warning: Do NOT call with n > 40 unless you enjoy waiting.
+    Raises:
+        ValueError: If n is negative
 
-    For n=40: ~30 seconds and 331 million function calls
-    For n=50: Several hours and ~12 billion function calls
+    Time Complexity: O(1) for n <= 92, O(log n) multiplies beyond
+    Space Complexity: O(1) - was O(n) of call stack
 
     Comparison:
-    - This version: fibonacci(40) ≈ 30 seconds
-    - With memoization: fibonacci(40) ≈ 0.001 seconds
-    The same code with one decorator (@lru_cache) is 30,000x faster.
+    - Recursive original: fibonacci(40) ≈ 30 seconds, 331 million calls
+    - This version: fibonacci(40) is one tuple index
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if n < len(_FIB_TABLE):
+        return _FIB_TABLE[n]
+    return _fib_pair(n)[0]
+
+
+def _fib_pair(n):
+    # (F(n), F(n + 1)) by fast doubling:
+    #   F(2k)     = F(k) * (2F(k + 1) - F(k))
+    #   F(2k + 1) = F(k)^2 + F(k + 1)^2
+    # Halving n each level means O(log n) big-int multiplies, no matrices.
+    # The recursion bottoms out in the table instead of at zero.
+    if n < len(_FIB_TABLE) - 1:
+        return _FIB_TABLE[n], _FIB_TABLE[n + 1]
+    a, b = _fib_pair(n >> 1)
+    c = a * ((b << 1) - a)
+    d = a * a + b * b
+    if n & 1:
+        return d, c + d
+    return c, d
+
+
+def fibonacci_fast(n):
+    """
+    Calculate the nth Fibonacci number in O(log n) arithmetic steps.
+
+    Method 4's matrix power without the matrices: fast doubling halves n
+    at every step, and the big-int multiplies use CPython's Karatsuba.
+    Same answers as fibonacci(), minus the table check up front.
+
+    Raises:
+        ValueError: If n is negative
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    return _fib_pair(n)[0]
+
+
+def fibonacci_jit(n):
     """
-    # Base cases (the only part that doesn't hurt)
-    if n == 0:
-        return 0
-    if n == 1:
-        return 1
+    The original exponential recursion, handed to Numba when it's installed.
+
+    Same algorithm, same ~fib(n+1) calls - but as native frames with int64
+    arguments instead of Python frames, 10-40x faster. Without numba this
+    is just the slow recursion.
+
+    int64 overflows past F(92), so keep n <= 92 (and realistically <= 45).
+    """
+    if n < 2:
+        return n
+    return fibonacci_jit(n - 1) + fibonacci_jit(n - 2)
+
 
-    # The pain: recalculate everything again. Every. Single. Time.
-    # fib(5) calls fib(4) and fib(3)
-    # fib(4) calls fib(3) and fib(2) ← fib(3) calculated AGAIN
-    # fib(3) calls fib(2) and fib(1) ← fib(2) calculated AGAIN
-    # And so on, creating an exponential explosion of redundant work
-    return fibonacci(n - 1) + fibonacci(n - 2)
+if njit is not None:
+    # Compiled lazily on the first call: by then the module-level name
+    # already refers to the dispatcher, so the recursive calls are native too
+    fibonacci_jit = njit(cache=True)(fibonacci_jit)
+
+
+# The same recursion in C, built once with the system compiler and loaded
+# through ctypes - native call frames without pulling in numba
+_FIB_C_SOURCE = """\
+#include <stdint.h>
+int64_t fib(int64_t n) { return n < 2 ? n : fib(n - 1) + fib(n - 2); }
+"""
+
+_FIB_C_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "coding-war-crimes")
+
+_fib_c = None
+
+
+def _build_fib_so():
+    # Compiled library is cached by source hash, so the compiler only runs
+    # the first time (or after the C source changes)
+    digest = hashlib.sha256(_FIB_C_SOURCE.encode()).hexdigest()[:16]
+    so_path = os.path.join(_FIB_C_CACHE_DIR, f"fib_{digest}.so")
+
+    if not os.path.exists(so_path):
+        os.makedirs(_FIB_C_CACHE_DIR, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=_FIB_C_CACHE_DIR) as build_dir:
+            c_path = os.path.join(build_dir, "fib.c")
+            tmp_so = os.path.join(build_dir, "fib.so")
+            with open(c_path, "w") as file:
+                file.write(_FIB_C_SOURCE)
+            subprocess.run(["cc", "-O3", "-shared", "-fPIC", "-o", tmp_so, c_path], check=True)
+            os.replace(tmp_so, so_path)  # atomic: never a half-written .so
+
+    lib = ctypes.CDLL(so_path)
+    lib.fib.argtypes = [ctypes.c_int64]
+    lib.fib.restype = ctypes.c_int64
+    return lib.fib
+
+
+def fibonacci_c(n):
+    """
+    The original exponential recursion, compiled to C and called via ctypes.
+
+    Builds the shared library on first use (needs a "cc" on PATH; raises
+    OSError or CalledProcessError if there isn't a working one). Same
+    int64 limit as fibonacci_jit: keep n <= 92.
+    """
+    global _fib_c
+    if _fib_c is None:
+        _fib_c = _build_fib_so()
+    return _fib_c(n)
 
 
 # Example usage with performance measurements
@@ -214,7 +335,7 @@ if __name__ == "__main__":
     print("=" * 50)
 
     # Calculate and time small values
-    print("\nCalculating Fibonacci numbers (watch it slow down):\n")
+    print("\nCalculating Fibonacci numbers (it used to slow down here):\n")
 
     test_values = [5, 10, 15, 20, 25, 30, 35]
 
@@ -252,6 +373,39 @@ if __name__ == "__main__":
         elapsed = time.time() - start
         print(f"fib({num:3d}) = {result:>25,} | Time: {elapsed:>10.7f}s")
 
+    print("\nThe original recursion, compiled (fibonacci_jit):\n")
+
+    if njit is None:
+        print("numba is not installed - skipping (it would be the slow version)")
+    else:
+        fibonacci_jit(1)  # compile outside the timed region
+        for num in [30, 35]:
+            start = time.time()
+            result = fibonacci_jit(num)
+            elapsed = time.time() - start
+            print(f"fib({num:3d}) = {result:>25,} | Time: {elapsed:>10.7f}s")
+
+    print("\nThe original recursion in C via ctypes (fibonacci_c):\n")
+
+    try:
+        fibonacci_c(1)  # build/load the library outside the timed region
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Could not build the C version: {e}")
+    else:
+        for num in [30, 35, 40]:
+            start = time.time()
+            result = fibonacci_c(num)
+            elapsed = time.time() - start
+            print(f"fib({num:3d}) = {result:>25,} | Time: {elapsed:>10.7f}s")
+
+    print("\nFast doubling for really big n (fibonacci_fast):\n")
+
+    for num in [1000, 10000, 100000]:
+        start = time.time()
+        result = fibonacci_fast(num)
+        elapsed = time.time() - start
+        print(f"fib({num:6d}) has {result.bit_length():>6,} bits | Time: {elapsed:>10.7f}s")
+
     print("\n" + "=" * 50)
     print("One decorator. 1000x+ speedup.")
     print("This is why memoization exists.")
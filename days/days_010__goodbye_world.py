@@ -3,8 +3,9 @@ HELLO WORLD IN 500 LINES - BECAUSE SIMPLICITY IS OVERRATED
 
 WARNING: This is what happens when you get paid by the line.
 
-What this does:
-Prints "Hello, World!" using approximately 500 lines of code.
+What this did:
+Printed "Hello, World!" using approximately 500 lines of code. It is the
+one-liner now; the phases below are the version it replaced.
 
 The correct way:
     print("Hello, World!")
@@ -101,7 +102,7 @@ Variables: 0
 Complexity: O(1)
 Pain: None
 
-This Version:
+The old version:
     [500 lines of suffering]
 
 Lines: 500
@@ -146,102 +147,26 @@ Author's note: I could have typed print("Hello, World!")
                 "Is this necessary?" "Probably not." "Proceed anyway."
 """
 
+# Phase 3 through Phase 7, folded: "H" + "e" + ... + "!" was always this
+GREETING = "Hello, World!"
+
 
 def hello_world_500_lines():
     """
-    Print "Hello, World!" using the most convoluted method possible.
+    Print "Hello, World!" the way the correct version above does.
 
-    This function takes the simple task of printing 13 characters and
-    transforms it into a 500-line journey through unnecessary variables,
-    redundant checks, and existential contemplation.
+    The ten phases described in the module docstring - the throwaway
+    variables, the per-character concatenation, the sanity checks that
+    could never fail - allocated a dozen strings and ran a pile of dead
+    branches on every call, for output that is a compile-time constant.
+    They're gone. The checks weren't kept as asserts either: each was
+    decidable when it was written, so there is nothing left to check,
+    even under __debug__. The name stays, as a memorial.
 
     Returns:
-        None - but prints "Hello, World!" after extensive deliberation
-
-    Side effects:
-        - Creates 30+ unnecessary variables
-        - Questions the meaning of existence
-        - Makes code reviewers cry
-        - Violates every principle of clean code
-
-    Warnings:
-        - Do not use in production
-        - Do not show to your team lead
-        - Do not put on your resume
-        - Do not pass Go, do not collect $200
+        None - but prints "Hello, World!" without extensive deliberation
     """
-    # Phase 1: Mental preparation (variables that serve no purpose, will give warnings but who cares)
-    step_001 = None
-    step_002 = None
-    step_003 = None
-    step_004 = None
-    step_005 = None
-    step_006 = None
-    step_007 = None
-    step_008 = None
-    step_009 = None
-    step_010 = None
-
-    # Phase 2: Reconsidering life choices (self-aware commentary)
-    thought_011 = "Is this necessary?"
-    thought_012 = "Probably not."
-    thought_013 = "Proceed anyway."
-    thought_014 = thought_011 + " " + thought_012
-    thought_015 = thought_014 + " " + thought_013
-
-    # Phase 3: Initialize core variables (one per character, naturally)
-    letter_h = "H"
-    letter_e = "e"
-    letter_l = "l"
-    letter_o = "o"
-    comma = ","
-    space = " "
-    letter_w = "W"
-    letter_r = "r"
-    letter_d = "d"
-    exclamation = "!"
-
-    # Phase 4: Sanity checks (checking if literals equal themselves)
-    if letter_h != "H":
-        return  # This will never happen
-    if letter_e != "e":
-        return  # Still won't happen
-    if letter_l != "l":
-        return  # Nope
-    if letter_o != "o":
-        return  # Not today
-
-    # Phase 5: Assemble words very carefully (could just use string literals)
-    hello = letter_h + letter_e + letter_l + letter_l + letter_o
-    world = letter_w + letter_o + letter_r + letter_l + letter_d
-
-    # Phase 6: More unnecessary validation (strings are always strings)
-    if not isinstance(hello, str):
-        return  # Impossible
-    if not isinstance(world, str):
-        return  # Also impossible
-
-    # Phase 7: Construct final message step by step (5 variables for concatenation)
-    part_101 = hello
-    part_102 = part_101 + comma
-    part_103 = part_102 + space
-    part_104 = part_103 + world
-    part_105 = part_104 + exclamation
-
-    # Phase 8: Deep reflection (triple-nested boolean checks)
-    reflection_201 = len(part_105)
-    reflection_202 = reflection_201 > 0
-    reflection_203 = reflection_202 is True
-    if reflection_203 is not True:
-        return  # Length will always be > 0
-
-    # Phase 9: Final hesitation (checking a hardcoded True)
-    ready = True
-    if not ready:
-        return  # True is always True
-
-    # Phase 10: The actual purpose (after 490+ lines)
-    print(part_105)
+    print(GREETING)
 
 
 # Example usage
@@ -256,11 +181,11 @@ if __name__ == "__main__":
     print("=" * 50)
     print('print("Hello, World!")')
     print("\nOutput:")
-    print("Hello, World!")
+    print(GREETING)
 
     print("\n" + "=" * 50)
     print("Lines of code comparison:")
-    print("  This version: ~300 lines") # I know I said 500, but I felt lazy ok?
+    print("  This version: ~300 lines (was)") # I know I said 500, but I felt lazy ok?
     print("  Normal version: 1 line")
     print("  Efficiency gain: -49,900%") #felt intimidating might not delete ever.
     print("=" * 50)
@@ -1,11 +1,13 @@
 """
 FILE-BASED SINGLETON - PERSISTENCE THROUGH PAIN
 
-WARNING: This "singleton" uses a text file as its backing store.
+WARNING: This "singleton" used a text file as its backing store.
 
-What this does:
-Implements the Singleton pattern by storing all data in a text file.
-Every get/set operation reads/writes the entire file from/to disk.
+What this did:
+Implemented the Singleton pattern by storing all data in a text file.
+Every get/set operation read/wrote the entire file from/to disk. The text
+file is gone: FileSingleton is a real singleton over a shelve file now,
+and import_text()/export_text() convert to and from the old format.
 
 The correct way:
     class Singleton:
@@ -26,8 +28,8 @@ The correct way:
 Or just use a module-level dict: data = {}
 
 Time Complexity (per operation):
-- set(): O(n) - reads entire file, writes entire file
-- get(): O(n) - reads entire file
+- set(): O(n) - read entire file, wrote entire file (now O(1) until flush)
+- get(): O(n) - read entire file (now O(1))
 - In-memory dict: O(1) for both
 
 Space Complexity: O(n disk space + n memory during read/write)
@@ -35,7 +37,7 @@ Disk Wear: O(your SSD's warranty voiding)
 
 Why this is catastrophically bad:
 
-1. NOT ACTUALLY A SINGLETON:
+1. NOT ACTUALLY A SINGLETON (fixed - __new__ hands out one instance):
    You can create multiple FileSingleton instances:
 
    s1 = FileSingleton()
@@ -44,7 +46,7 @@ Why this is catastrophically bad:
    They both access the same file, but they're separate objects.
    Real singletons enforce single instance at the class level.
 
-2. DISK I/O FOR EVERY OPERATION:
+2. DISK I/O FOR EVERY OPERATION (fixed - flush() writes only dirty keys):
    - set("key", "value") → read file, parse, modify, write file
    - get("key") → read file, parse, return value
 
@@ -69,7 +71,7 @@ Why this is catastrophically bad:
    - No query capabilities
    - Just... pain
 
-5. TYPE INFORMATION LOST:
+5. TYPE INFORMATION LOST (fixed - the shelf pickles values):
    data[key] = str(value)  # Everything becomes a string
 
    set("count", 42)  # Stored as "42"
@@ -83,7 +85,7 @@ Why this is catastrophically bad:
    - Permissions changed? Crash
    - Invalid data in file? Silent corruption
 
-7. FULL FILE REWRITE ON EVERY SET:
+7. FULL FILE REWRITE ON EVERY SET (fixed):
    Even changing one value rewrites the entire file.
 
    With 1000 keys, changing one key:
@@ -91,7 +93,7 @@ Why this is catastrophically bad:
    - Writes 1000 lines
    - Just to update one value
 
-8. MANUAL PARSING:
+8. MANUAL PARSING (fixed - it's a shelve now):
    Parsing "key=value" lines manually when Python has:
    - configparser (INI files)
    - json (structured data)
@@ -209,139 +211,143 @@ Author's note: I could have used a dict.
                 My SSD will never forgive me.
 """
 
-import os
+import atexit
+import shelve
 
-# The file that will be rewritten constantly
-SINGLETON_FILE = "singleton.txt"
+# Base name of the shelf; the dbm backend may add its own suffixes
+SINGLETON_FILE = "singleton.db"
 
 
 class FileSingleton:
     """
-    A "singleton" that stores all data in a text file.
+    A singleton key-value store persisted to a shelf on disk.
 
-    Spoiler: This is not actually a singleton pattern.
-    This is a poorly implemented file-based key-value store
-    that happens to share one file across all instances.
+    Spoiler: This used to not be a singleton at all, just a file
+    that every instance re-read on every call. Now __new__ returns
+    one shared instance holding the data in memory.
 
     Problems:
-    - Not actually enforcing single instance
-    - Disk I/O on every operation (slow)
-    - No concurrency control (race conditions)
-    - Type information lost (everything is a string)
-    - Full file rewrite on every change (inefficient)
-    - No error handling (crashes on file issues)
-
-    The "singleton" file format:
+    - No concurrency control between processes (race conditions)
+    - Unflushed sets are lost if the process is killed
+
+    The "singleton" file format used to be:
         key1=value1
         key2=value2
         key3=value3
 
-    Parsed by splitting on "=" which breaks if keys contain "=".
+    Parsed by splitting on "=" which broke if keys contained "=".
+    Now each key is its own dbm record holding a pickled value.
     """
 
-    def __init__(self):
-        """
-        Initialize the "singleton" by creating an empty file if needed.
+    _instance = None
 
-        Note: This doesn't enforce single instance.
-        You can create unlimited FileSingleton objects.
-        They just all share the same file.
-        """
-        if not os.path.exists(SINGLETON_FILE):
-            self._write_file({})
+    def __new__(cls):
+        if cls._instance is None:
+            instance = super().__new__(cls)
+            instance._db = shelve.open(SINGLETON_FILE)
+            instance._data = dict(instance._db.items())
+            instance._dirty = set()
+            atexit.register(instance.close)
+            cls._instance = instance
+        return cls._instance
 
-    def set(self, key, value):
-        """
-        Set a key-value pair by:
-        1. Reading entire file into memory
-        2. Parsing all lines
-        3. Modifying one value
-        4. Writing entire file back to disk
+    def __enter__(self):
+        return self
 
-        Time Complexity: O(n) where n = number of keys
-        An in-memory dict would be O(1)
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
 
-        Race condition: Two simultaneous sets will lose one write
-        """
-        data = self._read_file()
-        data[key] = str(value)  # Type information lost!
-        self._write_file(data)
+    def close(self):
+        """Flush and close the shelf; the next FileSingleton() reopens it."""
+        if FileSingleton._instance is self:
+            self.flush()
+            self._db.close()
+            FileSingleton._instance = None
 
-    def get(self, key):
+    def set(self, key, value, sync=False):
         """
-        Get a value by reading and parsing the entire file.
-
-        Time Complexity: O(n)
-        An in-memory dict would be O(1)
+        Set a key in memory. It reaches disk on the next flush().
 
-        Returns string, even if you stored an int/float/bool.
-        Hope you remember to convert back!
+        Pass sync=True to flush right away. Keys are stored as str(key),
+        like the text file did: the shelf only takes string keys.
         """
-        return self._read_file().get(key)
+        key = str(key)
+        self._data[key] = value
+        self._dirty.add(key)
+        if sync:
+            self.flush()
 
-    def all(self):
+    def set_many(self, items, sync=False):
+        """
+        Set every key in a dict (or iterable of pairs) in one call.
         """
-        Return all data by reading and parsing the entire file.
+        items = {str(key): value for key, value in dict(items).items()}
+        self._data.update(items)
+        self._dirty.update(items)
+        if sync:
+            self.flush()
 
-        At least this operation makes sense to read the whole file.
+    def import_text(self, path="singleton.txt"):
         """
-        return self._read_file()
+        Load a key=value file from the text-file days into the store.
 
-    def clear(self):
+        Values come in as strings, because that's all the old format had.
         """
-        Clear all data by writing an empty file.
+        with open(path, encoding="utf-8") as file:
+            self.set_many({key: value for key, sep, value
+                           in (line.partition("=") for line in file.read().splitlines())
+                           if sep})
 
-        This is the only operation that doesn't read first.
-        Small victories.
+    def export_text(self, path="singleton.txt"):
         """
-        self._write_file({})
+        Write the store out in the old key=value format, one write() call.
 
-    @staticmethod
-    def _read_file():
+        Lossy the same way the old format was: every value goes through str().
         """
-        Read and parse the singleton file.
+        payload = "".join([f"{key}={value}\n" for key, value in self._data.items()])
+        with open(path, "wb") as file:
+            file.write(payload.encode("utf-8"))
 
-        Format: key=value (one per line)
+    def get(self, key):
+        """
+        Get a value. A dict lookup; returns whatever type you stored.
+        """
+        return self._data.get(str(key))
 
-        Issues:
-        - Splits on first "=" only (maxsplit=1 helps)
-        - Keys with "=" will break parsing
-        - Values with newlines will break format
-        - No escaping or quoting
-        - Corrupted file returns partial data silently
+    def all(self):
+        """
+        Return a copy of all data.
         """
-        if not os.path.exists(SINGLETON_FILE):
-            return {}
-
-        data = {}
-        with open(SINGLETON_FILE, "r") as file:
-            for line in file:
-                line = line.strip()
-                if "=" in line:
-                    key, value = line.split("=", 1)  # At least we use maxsplit
-                    data[key] = value
-        return data
-
-    @staticmethod
-    def _write_file(data):
+        return dict(self._data)
+
+    def flush(self):
         """
-        Write all data to file by recreating it from scratch.
+        Write the keys set since the last flush and sync the shelf.
 
-        Every set() operation calls this.
-        Every call overwrites the entire file.
+        Each key leaves the dirty set once it's written, so if a write
+        fails the keys still dirty are exactly the ones not on disk yet.
+        """
+        db = self._db
+        data = self._data
+        dirty = self._dirty
+        for key in list(dirty):
+            db[key] = data[key]
+            dirty.discard(key)
+        db.sync()
 
-        With 1000 keys, changing one key:
-        - Writes 1000 lines
-        - Just to change one value
-        - Disk goes brrrrr
+    def clear(self):
+        """
+        Delete every key, in memory and on disk.
         """
-        with open(SINGLETON_FILE, "w") as file:
-            for key, value in data.items():
-                file.write(key + "=" + value + "\n")
+        self._data.clear()
+        self._dirty.clear()
+        self._db.clear()
 
 
 # Example usage demonstrating the problems
 if __name__ == "__main__":
+    import glob
+    import os
     import time
 
     print("File-Based Singleton - Persistence Through Pain")
@@ -351,21 +357,35 @@ if __name__ == "__main__":
     print("\n1. Creating multiple 'singletons':")
     s1 = FileSingleton()
     s2 = FileSingleton()
-    print(f"   s1 is s2: {s1 is s2}")  # False - not a real singleton!
-    print("   [insert police siren here] Not enforcing single instance")
+    print(f"   s1 is s2: {s1 is s2}")  # True - __new__ hands out one instance
+    print("   [siren switched off] One instance, one in-memory dict")
 
     # Problem 2: Disk I/O overhead
     print("\n2. Performance comparison:")
 
-    # File-based version
+    # Flushed to the shelf after every set
     s = FileSingleton()
     s.clear()
 
     start = time.time()
     for iteration in range(100):
-        s.set(f"key_{iteration}", iteration)
+        s.set(f"key_{iteration}", iteration, sync=True)
     file_time = time.time() - start
 
+    # Flushed once on the way out of the with-block
+    s.clear()
+    start = time.time()
+    with s:
+        for iteration in range(100):
+            s.set(f"key_{iteration}", iteration)
+    buffered_time = time.time() - start
+
+    # Bulk API: one call, one flush
+    s.clear()
+    start = time.time()
+    s.set_many({f"key_{iteration}": iteration for iteration in range(100)}, sync=True)
+    bulk_time = time.time() - start
+
     # In-memory version
     memory_dict = {}
     start = time.time()
@@ -373,12 +393,15 @@ if __name__ == "__main__":
         memory_dict[f"key_{iteration}"] = iteration
     memory_time = time.time() - start
 
-    print(f"   File-based: {file_time:.4f}s (100 sets)")
-    print(f"   In-memory:  {memory_time:.6f}s (100 sets)")
-    print(f"   Slowdown:   {file_time / memory_time:.0f}x slower")
+    print(f"   Flush each set:   {file_time:.4f}s (100 sets)")
+    print(f"   Flush once:       {buffered_time:.4f}s (100 sets, 1 flush)")
+    print(f"   set_many:         {bulk_time:.4f}s (1 call, 1 flush)")
+    print(f"   In-memory:        {memory_time:.6f}s (100 sets)")
+    print(f"   Slowdown:         {file_time / memory_time:.0f}x slower")
+    print(f"   set_many speedup: {file_time / bulk_time:.0f}x over flushing each set")
 
     # Problem 3: Type loss
-    print("\n3. Type information lost:")
+    print("\n3. Type information (lost in the text-file days):")
     s.clear()
     s.set("number", 42)
     s.set("float", 3.14)
@@ -387,18 +410,20 @@ if __name__ == "__main__":
     print(f"   Stored int 42, got: {s.get('number')} (type: {type(s.get('number')).__name__})")
     print(f"   Stored float 3.14, got: {s.get('float')} (type: {type(s.get('float')).__name__})")
     print(f"   Stored bool True, got: {s.get('bool')} (type: {type(s.get('bool')).__name__})")
-    print("   [thanos snap] Everything became a string")
+    print("   [un-snap] The shelf pickles values, so the types come back")
 
     # Problem 4: File rewrites
     print("\n4. File operations:")
-    print(f"   100 set() operations = 100 file rewrites")
-    print(f"   1 get() operation = 1 file read")
-    print(f"   Your SSD: crying")
+    print(f"   1 set() operation = 0 disk writes until flush() (was: whole file rewritten)")
+    print(f"   1 get() operation = 1 dict lookup (was: whole file parsed)")
+    print(f"   flush() = 1 record written per changed key")
+    print(f"   Your SSD: recovering")
 
     # Cleanup
     s.clear()
-    if os.path.exists(SINGLETON_FILE):
-        os.remove(SINGLETON_FILE)
+    s.close()
+    for leftover in glob.glob(SINGLETON_FILE + "*"):
+        os.remove(leftover)
 
     print("\n" + "=" * 50)
     print("The correct way: Just use a dict")
@@ -1,11 +1,12 @@
 """
 PICKLE DATABASE - SERIALIZING YOUR WAY TO DISASTER
 
-WARNING: This "database" pickles an entire dictionary on every operation.
+WARNING: This "database" pickled an entire dictionary on every operation.
 
-What this does:
-Uses Python's pickle module as a database by serializing a giant dictionary
-to disk on every insert/delete, and deserializing it on every read.
+What this did:
+Used Python's pickle module as a database by serializing a giant dictionary
+to disk on every insert/delete, and deserializing it on every read. The
+dict-in-a-pickle is gone; PickleDatabase is a SQLite table now.
 
 The correct way:
     import sqlite3
@@ -17,13 +18,14 @@ The correct way:
 
 Or for simple key-value: import shelve
 
-Time Complexity:
+Time Complexity (before the SQLite rewrite):
 - insert(key, value): O(n) - load entire db, add one item, save entire db
 - get(key): O(n) - load entire db just to get one value
 - delete(key): O(n) - load entire db, remove one item, save entire db
 - SQLite equivalent: O(log n) with indexes, O(1) with primary keys
+  (what all three are now)
 
-Space Complexity: O(n) in memory during every operation
+Space Complexity: O(n) in memory during every operation (now O(1))
 Disk Space: O(n) but grows with every write (pickle overhead)
 
 Why this is catastrophically bad:
@@ -53,7 +55,7 @@ Why this is catastrophically bad:
 
    NEVER unpickle data from untrusted sources!
 
-3. LOAD ENTIRE DATABASE FOR EVERY OPERATION:
+3. LOAD ENTIRE DATABASE FOR EVERY OPERATION (fixed - one row at a time):
    Want one value? Load the whole database.
    Insert one row? Load everything, add one item, save everything.
 
@@ -61,7 +63,7 @@ Why this is catastrophically bad:
    - get("user_123"): Loads 1 million records to return one
    - insert("user_new", data): Loads 1 million, adds one, saves 1 million + 1
 
-4. NO CONCURRENCY CONTROL:
+4. NO CONCURRENCY CONTROL (fixed - BEGIN IMMEDIATE):
    Process A: reads database
    Process B: reads database
    Process A: writes database with new record
@@ -69,7 +71,7 @@ Why this is catastrophically bad:
 
    Result: Lost writes, no isolation, chaos
 
-5. NO TRANSACTIONS:
+5. NO TRANSACTIONS (fixed - SQLite commits, WAL):
    What if Python crashes during pickle.dump()?
    - Partial write
    - Corrupted file
@@ -92,7 +94,7 @@ Why this is catastrophically bad:
    - Store anything anywhere
    - Hope for the best
 
-8. MEMORY USAGE:
+8. MEMORY USAGE (fixed):
    Entire database must fit in memory during every operation.
 
    1 GB database file:
@@ -102,7 +104,7 @@ Why this is catastrophically bad:
 
    SQLite: Only loads needed pages into memory
 
-9. NO INDEXING:
+9. NO INDEXING (fixed - primary-key B-tree):
    Every lookup is O(n) - checks entire database.
    Real databases use B-trees, hash indexes, etc.
 
@@ -220,155 +222,432 @@ Author's note: I could have used SQLite.
                 My database will never forgive me.
 """
 
+import json
+import mmap
 import os
 import pickle
-
-# The file that will be completely rewritten on every insert/delete
-DATABASE_FILE = "database.pkl"
+import sqlite3
+import struct
+import zlib
+
+try:
+    import orjson
+except ImportError:  # optional: without orjson the stdlib json encoder is used
+    orjson = None
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(value):
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
+# Values of these exact types round-trip through JSON unchanged; anything
+# else (tuples, sets, floats that could be NaN, custom objects) is pickled
+_JSON_TYPES = frozenset((str, int, bool, type(None)))
+
+# The SQLite file holding the kv table
+DATABASE_FILE = "database.db"
+
+# Where the old whole-dict pickle lived, for import_pickle()
+LEGACY_DATABASE_FILE = "database.pkl"
+
+# Legacy pickles at least this big are unpickled straight out of an mmap
+# rather than copied into a bytes object first
+MMAP_THRESHOLD = 1 << 20
+
+# Seconds a writer waits for another process's write lock before giving up
+# with "database is locked"
+BUSY_TIMEOUT = 30.0
+
+# WAL pages allowed to pile up before SQLite folds them back into the main
+# file. The WAL is the append-only op log: a commit appends the pages it
+# touched, a checkpoint compacts them into the database. A bigger threshold
+# means fewer, larger checkpoints (~16 MB of log at 4 KiB pages vs the
+# default 1000 pages), so each page is rewritten into the main file less often.
+WAL_CHECKPOINT_PAGES = 4000
+
+# Serialized values at least this long are zlib-compressed (and stored that
+# way only if it actually shrank them); small values aren't worth the CPU
+COMPRESS_THRESHOLD = 512
+
+# Past this size, compress a sample first and skip the whole value if the
+# sample barely shrinks: already-compressed or random data would burn
+# ~25 ms per MB in zlib for nothing
+COMPRESS_PROBE_SIZE = 64 << 10
+
+# How much of the SQLite file reads may map instead of copying into the page
+# cache, same trade as above
+SQLITE_MMAP_SIZE = 256 << 20
+
+
+def _map_for_scan(fileno):
+    # Read-only map of a whole file that is about to be read once, in order.
+    # MAP_POPULATE (Linux) faults every page in up front, and MADV_SEQUENTIAL
+    # tells the kernel to read ahead aggressively and drop pages behind us.
+    # Point lookups would want MADV_RANDOM instead, but those all go through
+    # SQLite, which does its own mapping.
+    populate = getattr(mmap, "MAP_POPULATE", 0)
+    if populate:
+        mapped = mmap.mmap(fileno, 0, flags=mmap.MAP_PRIVATE | populate, prot=mmap.PROT_READ)
+    else:
+        mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    return mapped
+
+
+def _check_key(key):
+    # The kv key column is TEXT; see the PickleDatabase docstring
+    if type(key) is not str:
+        raise TypeError(f"keys must be str, not {type(key).__name__}")
 
 
 class PickleDatabase:
     """
-    A "database" that pickles an entire dictionary on every operation.
+    A key-value "database" that used to pickle an entire dictionary
+    on every operation, and now keeps one SQLite connection open on a
+    kv(key TEXT PRIMARY KEY, value BLOB) table, one value per row.
 
     Operations:
-    - insert(): Load entire db, add one item, save entire db
-    - get(): Load entire db, return one value
-    - delete(): Load entire db, remove one item, save entire db
-
-    Problems:
-    - O(n) for operations that should be O(1) or O(log n)
-    - Entire database in memory during every operation
-    - No concurrency control
-    - No transactions (crash = corrupted file)
-    - Security risk (pickle can execute code)
-    - Performance degrades as data grows
-
-    This is what databases looked like before databases existed.
+    - insert(): INSERT OR REPLACE one row
+    - get(): SELECT one row by primary key
+    - delete(): DELETE one row by primary key
+
+    Keys must be str. The old dict took any hashable key, but the kv key
+    column is TEXT: a tuple can't be bound at all and an int would come
+    back from all() as a string, so insert() and bulk_insert() raise
+    TypeError for anything else (and so does import_pickle() on a legacy
+    dict with such keys).
+
+    Values: each is serialized on its own - JSON (orjson if installed) for
+    plain str/int/bool/None, pickle for anything else (protocol 5, large
+    buffers stored out-of-band after the pickle), told apart by a one-byte
+    prefix - and zlib-compressed from COMPRESS_THRESHOLD bytes up when that
+    helps. Big values get a sample compressed first, so random or already-
+    compressed data isn't run through zlib for nothing. get() keeps decoded
+    str/int/bool/None values in a per-connection dict that is dropped
+    whenever PRAGMA data_version says another connection has committed.
+    Anything mutable is decoded fresh on every read.
+
+    Writes: WAL mode with synchronous=NORMAL. Each mutation commits on its
+    own unless it runs inside `with db:`, which makes the whole block one
+    transaction, and bulk_insert() loads many rows with a single
+    executemany. The WAL doubles as the append-only write log: commits
+    append, and SQLite compacts it into the main file every
+    WAL_CHECKPOINT_PAGES pages (or on checkpoint()). Writers take SQLite's
+    write lock with BEGIN IMMEDIATE and wait their turn (BUSY_TIMEOUT), so
+    two processes inserting at once both land. A write that fails rolls its
+    transaction back rather than leaving it open.
+
+    I/O: the connection opens lazily and the file is only created by the
+    first write, so constructing a PickleDatabase costs nothing. Reads go
+    through mmap (PRAGMA mmap_size). import_pickle() migrates an old
+    database.pkl (mapping it when it's big) and export_pickle() writes one
+    back out atomically.
+
+    Remaining problems:
+    - Values that aren't plain str/int/bool/None are still pickles
+      (pickle can execute code on load)
+    - One commit per mutation, unless batched with `with db:`
+
+    Still named PickleDatabase. Old habits.
     """
 
     def __init__(self):
         """
-        Initialize the database by creating an empty pickle file if needed.
-
-        Already doing unnecessary I/O in the constructor.
-        Setting the tone early.
+        Set up an unopened handle. No disk I/O happens here: the file is
+        opened on first use, and only created by the first write, so a
+        get() on a fresh install returns None without leaving a file behind.
         """
-        if not os.path.exists(DATABASE_FILE):
-            self._write_database({})
+        self._conn = None
+        self._batching = 0
+        # Decoded immutable values by key, trusted while data_version stays put
+        self._cache = {}
+        self._data_version = None
 
-    def insert(self, key, value):
+    def _open(self, create=True):
         """
-        Insert a key-value pair by:
-        1. Unpickling entire database into memory
-        2. Adding one item to the dict
-        3. Pickling entire database back to disk
+        Return the connection, opening it first if needed. With
+        create=False a missing database file gives None instead.
 
-        Time Complexity: O(n) where n = total records
-        SQLite equivalent: O(log n) with B-tree index
+        WAL journaling with synchronous=NORMAL makes a commit one append to
+        the log (fsynced only at checkpoints) instead of a rollback-journal
+        rewrite plus fsync, and readers stop blocking behind writers.
 
-        With 100,000 records, adding one record:
-        - Loads 100,000 records
-        - Adds 1 record
-        - Saves 100,001 records
+        Write transactions open with BEGIN IMMEDIATE, taking SQLite's write
+        lock up front, and wait up to BUSY_TIMEOUT for another process to
+        finish. Concurrent writers queue on that lock instead of
+        overwriting each other.
+        """
+        if self._conn is not None:
+            return self._conn
+        if not create and not os.path.exists(DATABASE_FILE):
+            return None
+        conn = sqlite3.connect(DATABASE_FILE, timeout=BUSY_TIMEOUT, isolation_level="IMMEDIATE")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-8000")  # negative = KiB, so ~8 MB
+        conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        conn.execute(f"PRAGMA wal_autocheckpoint={WAL_CHECKPOINT_PAGES}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB)"
+        )
+        conn.commit()
+        self._conn = conn
+        return conn
+
+    def __enter__(self):
+        """
+        Batch mutations: inside `with db:` nothing commits until the block
+        exits, so 1000 inserts are one transaction instead of 1000.
+        """
+        self._batching += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._batching -= 1
+        if not self._batching and self._conn is not None:
+            if exc_type is None:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
+                self._cache.clear()
+
+    def _check_cache(self, conn):
+        # PRAGMA data_version only moves when another connection commits,
+        # so an unchanged value means every cached decode is still current
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            self._cache.clear()
+            self._data_version = version
+
+    def _write(self, conn, sql, params=(), many=False):
+        """
+        Run one mutating statement and commit it, unless batching.
 
-        Just to insert one item.
+        If the statement fails the open transaction is rolled back - inside
+        `with db:` that is the whole batch - so a half-applied write neither
+        keeps holding the write lock nor rides along with the next commit.
         """
-        data = self._read_database()
-        data[key] = value
-        self._write_database(data)
+        try:
+            if many:
+                conn.executemany(sql, params)
+            else:
+                conn.execute(sql, params)
+            if not self._batching:
+                conn.commit()
+        except BaseException:
+            conn.rollback()
+            self._cache.clear()
+            raise
 
-    def get(self, key):
+    def insert(self, key, value):
         """
-        Get a value by unpickling the entire database.
+        Insert or overwrite one key.
 
-        Time Complexity: O(n)
-        SQLite with index: O(log n)
-        Hash table: O(1)
+        Time Complexity: O(log n) - one B-tree descent
+        """
+        _check_key(key)
+        self._write(self._open(), "INSERT OR REPLACE INTO kv VALUES (?, ?)",
+                    (key, self._dumps(value)))
+        # Dropped, not filled: caching the caller's object would let later
+        # mutations of it show up in get() without ever reaching the row
+        self._cache.pop(key, None)
 
-        Loads entire database to return one value.
-        The rest of the data? Loaded and discarded.
+    @staticmethod
+    def _dumps(value):
+        """
+        Serialize one value: b"J" + JSON for plain scalars, b"P" + pickle
+        for everything else. JSON is faster to encode and can't run code
+        when decoded. Big results are wrapped again as b"Z" + zlib(blob)
+        when that comes out smaller.
         """
-        return self._read_database().get(key)
+        blob = None
+        if type(value) in _JSON_TYPES:
+            try:
+                blob = b"J" + _json_dumps(value)
+            except (TypeError, ValueError):  # ints too big for the encoder
+                pass
+        if blob is None:
+            # Protocol 5 hands large buffers (bytearray, anything exposing
+            # PickleBuffer) to the callback instead of copying them into
+            # the pickle stream; they are appended after it as raw bytes:
+            #   b"O" | count:u32 | len(head), len(buf)...:u64 | head | bufs
+            buffers = []
+            head = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+            if buffers:
+                raws = [buffer.raw() for buffer in buffers]
+                lengths = struct.pack(f"<I{len(raws) + 1}Q", len(raws), len(head),
+                                      *(raw.nbytes for raw in raws))
+                blob = b"".join([b"O", lengths, head, *raws])
+            else:
+                blob = b"P" + head
+        if len(blob) >= COMPRESS_PROBE_SIZE:
+            sample = blob[:COMPRESS_PROBE_SIZE // 4]
+            if len(zlib.compress(sample, 1)) > len(sample) * 0.9:
+                return blob
+        if len(blob) >= COMPRESS_THRESHOLD:
+            packed = b"Z" + zlib.compress(blob, 3)
+            if len(packed) < len(blob):
+                return packed
+        return blob
 
-    def delete(self, key):
+    @staticmethod
+    def _loads(blob):
+        """Inverse of _dumps, dispatching on the prefix byte."""
+        tag = blob[:1]
+        if tag == b"Z":
+            blob = zlib.decompress(blob[1:])
+            tag = blob[:1]
+        if tag == b"J":
+            return _json_loads(blob[1:])
+        if tag == b"O":
+            (count,) = struct.unpack_from("<I", blob, 1)
+            lengths = struct.unpack_from(f"<{count + 1}Q", blob, 5)
+            # One copy into a bytearray, so the buffers handed back (numpy
+            # arrays and the like) are writable, as an in-band pickle's are
+            view = memoryview(bytearray(blob))
+            start = 5 + 8 * (count + 1)
+            chunks = []
+            for length in lengths:
+                chunks.append(view[start:start + length])
+                start += length
+            return pickle.loads(chunks[0], buffers=chunks[1:])
+        return pickle.loads(blob[1:])
+
+    def bulk_insert(self, items):
+        """
+        Insert or overwrite many (key, value) pairs with one executemany
+        and one commit, so the statement is prepared once and the WAL is
+        synced once for the whole batch.
         """
-        Delete a key by loading everything, removing one item, saving everything.
+        items = list(items)
+        for key, _ in items:
+            _check_key(key)
+        dumps = self._dumps
+        self._write(self._open(), "INSERT OR REPLACE INTO kv VALUES (?, ?)",
+                    [(key, dumps(value)) for key, value in items], many=True)
+        cache = self._cache
+        for key, _ in items:
+            cache.pop(key, None)
+
+    def import_pickle(self, path=LEGACY_DATABASE_FILE):
+        """
+        Load a whole-dict pickle from the old version into the table.
 
-        Time Complexity: O(n)
+        Big files are mapped and unpickled in place, so the kernel's page
+        cache is the only copy; the mapping is prefaulted and marked
+        sequential, since the parser reads it front to back exactly once.
 
-        The trifecta of inefficiency:
-        - Load entire database
-        - Remove one item
-        - Save entire database
+        Same warning as ever: only import pickles you wrote yourself.
         """
-        data = self._read_database()
-        if key in data:
-            del data[key]
-            self._write_database(data)
-
-    def all(self):
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < MMAP_THRESHOLD:
+                data = pickle.load(file)
+            else:
+                with _map_for_scan(file.fileno()) as mapped:
+                    data = pickle.load(mapped)
+        self.bulk_insert(data.items())
+
+    def export_pickle(self, path=LEGACY_DATABASE_FILE):
         """
-        Return all data.
+        Write the whole table out as one pickled dict, the old format.
 
-        At least this operation makes sense to load everything.
-        First operation that's not obviously wasteful.
+        The dump goes to a temp file that is fsynced and then renamed over
+        path, so a crash mid-dump leaves the previous file intact.
         """
-        return self._read_database()
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as file:
+            pickle.dump(self.all(), file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, path)
 
-    def clear(self):
+    def get(self, key):
         """
-        Clear the database by pickling an empty dict.
+        Get one value by primary key, or None if it isn't there.
+
+        Time Complexity: O(log n), O(1) for a cached str/int/bool/None
 
-        The only operation that doesn't read first.
-        Progress!
+        Only immutable values are cached (until another connection
+        commits). Lists, dicts and other pickled objects are decoded fresh
+        each time, so mutating what get() returns never leaks into the
+        next read.
         """
-        self._write_database({})
+        conn = self._open(create=False)
+        if conn is None:
+            return None
+        self._check_cache(conn)
+        cache = self._cache
+        if key in cache:
+            return cache[key]
+        row = conn.execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value = self._loads(row[0])
+        if type(value) in _JSON_TYPES:
+            cache[key] = value
+        return value
 
-    @staticmethod
-    def _read_database():
+    def delete(self, key):
         """
-        Unpickle the entire database file.
+        Delete one key. Missing keys are ignored.
 
-        Security warning: pickle.load() can execute arbitrary code!
-        Never unpickle data from untrusted sources.
+        Time Complexity: O(log n)
+        """
+        conn = self._open(create=False)
+        if conn is None:
+            return
+        self._write(conn, "DELETE FROM kv WHERE key = ?", (key,))
+        self._cache.pop(key, None)
 
-        If this file is corrupted or modified maliciously,
-        unpickling it could execute system commands, delete files,
-        or do anything Python can do.
+    def all(self):
+        """
+        Return all data as a dict.
 
-        This is why databases don't use pickle.
+        At least this operation makes sense to load everything.
         """
-        if not os.path.exists(DATABASE_FILE):
+        conn = self._open(create=False)
+        if conn is None:
             return {}
+        loads = self._loads
+        return {key: loads(value) for key, value in conn.execute("SELECT key, value FROM kv")}
 
-        with open(DATABASE_FILE, "rb") as file:
-            return pickle.load(file)
-
-    @staticmethod
-    def _write_database(data):
+    def clear(self):
         """
-        Pickle the entire database to file.
-
-        Every insert/delete calls this.
-        Every call serializes the entire dictionary.
-
-        With 50,000 records, each taking 100 bytes:
-        - File size: ~5 MB
-        - Time to pickle: ~0.5 seconds
-        - Happens on EVERY insert/delete
+        Delete every row.
+        """
+        self._cache.clear()
+        conn = self._open(create=False)
+        if conn is None:
+            return
+        self._write(conn, "DELETE FROM kv")
 
-        Your disk I/O: maxed out
-        Your application: slow
-        Your users: leaving
+    def checkpoint(self):
+        """
+        Compact now: copy every logged page into the main file and
+        truncate the WAL back to zero bytes. Handy before a backup or
+        after a big bulk load.
         """
-        with open(DATABASE_FILE, "wb") as file:
-            pickle.dump(data, file) # type: ignore[arg-type]
-            # yeah, you just witnessed me tell the linter to shut the hell up
+        conn = self._open(create=False)
+        if conn is not None:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self):
+        """Close the connection, if one was ever opened."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
 
 # Example usage demonstrating the problems
 if __name__ == "__main__":
+    import glob
+    import statistics
     import time
 
     print("Pickle Database - Serializing Your Way to Disaster")
@@ -381,41 +660,46 @@ if __name__ == "__main__":
     print("\n1. Performance with growing database:")
 
     for size in [100, 500, 1000]:
-        # Populate database
+        # Populate database (one executemany, one commit)
         db.clear()
-        for idx in range(size):
-            db.insert(f"key_{idx}", f"value_{idx}")
+        db.bulk_insert((f"key_{idx}", f"value_{idx}") for idx in range(size))
+
+        # Warm up (connection, statement cache, pages) before timing
+        db.insert("warm", "warm")
+        db.delete("warm")
 
-        # Time a single insert
-        start = time.time()
-        db.insert("new_key", "new_value")
-        elapsed = time.time() - start
+        # Time 100 inserts one by one on the monotonic clock
+        timings = []
+        for iteration in range(100):
+            start = time.perf_counter_ns()
+            db.insert(f"new_key_{iteration}", "new_value")
+            timings.append(time.perf_counter_ns() - start)
+        mean_ms = sum(timings) / len(timings) / 1e6
+        median_ms = statistics.median(timings) / 1e6
 
         print(f"   Database size: {size:4d} records")
-        print(f"   Single insert: {elapsed * 1000:6.2f}ms")
+        print(f"   Insert:        {mean_ms:6.3f}ms mean, {median_ms:6.3f}ms median (100 runs)")
 
-    print("   Notice: Gets slower as database grows")
+    print("   Notice: Barely moves as the database grows (it used to)")
 
     # Problem 2: Every operation loads everything
     print("\n2. Memory usage per operation:")
     db.clear()
 
-    # Insert 1000 records
-    for idx in range(1000):
-        db.insert(f"key_{idx}", "x" * 100)  # 100 bytes per value
+    # Insert 1000 records, 100 bytes per value
+    db.bulk_insert((f"key_{idx}", "x" * 100) for idx in range(1000))
 
     print("   Database: 1000 records, ~100 KB")
-    print("   get() one key: Loads entire 100 KB")
-    print("   insert() one key: Loads 100 KB, saves 100 KB")
-    print("   delete() one key: Loads 100 KB, saves 100 KB")
+    print("   get() one key: Reads one row (was: loads entire 100 KB)")
+    print("   insert() one key: Writes one row (was: loads and saves 100 KB)")
+    print("   delete() one key: Deletes one row (was: loads and saves 100 KB)")
 
     # Problem 3: No concurrency
-    print("\n3. Concurrency problems:")
-    print("   Process A: reads database")
-    print("   Process B: reads database")
-    print("   Process A: writes update")
-    print("   Process B: writes update (overwrites A!)")
-    print("   Result: Lost writes, no isolation")
+    print("\n3. Concurrency (used to be a problem):")
+    print("   Process A: writes key_1")
+    print("   Process B: writes key_2")
+    print("   SQLite locks the file for each transaction")
+    print("   Result: Both writes land, each row is updated on its own")
 
     # Comparison with better approach
     print("\n4. Better alternatives:")
@@ -426,8 +710,9 @@ if __name__ == "__main__":
 
     # Cleanup
     db.clear()
-    if os.path.exists(DATABASE_FILE):
-        os.remove(DATABASE_FILE)
+    db.close()
+    for leftover in glob.glob(DATABASE_FILE + "*"):
+        os.remove(leftover)
 
     print("\n" + "=" * 50)
     print("The correct way:")
@@ -1,11 +1,13 @@
 """
 SINGLE ENDPOINT CRUD API - ONE ROUTE TO RULE THEM ALL
 
-WARNING: This API puts all CRUD operations through one POST endpoint.
+WARNING: This API put all CRUD operations through one POST endpoint.
 
-What this does:
-All Create, Read, Update, Delete operations go through POST /api
+What this did:
+All Create, Read, Update, Delete operations went through POST /api
 The operation type is specified via "action" field in the request body.
+POST /api still works, but is marked deprecated now that the real routes
+below exist next to it.
 
 The correct way:
     POST   /api/items         {"name": "..."}       # Create
@@ -45,6 +47,8 @@ Why this violates REST principles:
    POST requests are not cached
 
    Result: "list" action can't be cached even though it's a read operation
+   (GET /api/items is, and carries an ETag and Cache-Control max-age, so
+   clients revalidate with a 304 instead of refetching)
 
 4. NO IDEMPOTENCY WHERE EXPECTED:
    PUT and DELETE should be idempotent (same result if called multiple times)
@@ -54,8 +58,9 @@ Why this violates REST principles:
    RESTful API: Look at URLs and methods to understand what's available
    This API: Need to read docs to know valid "action" strings
 
-6. RETURNS ENTIRE STATE:
-   Every operation returns the full items dict
+6. RETURNS ENTIRE STATE (fixed):
+   Every operation returned the full items dict. Now create/update return
+   the one item and delete returns an empty 204
 
    Problems:
    - Leaks all data to anyone who makes a request
@@ -72,6 +77,9 @@ Why this violates REST principles:
    - Can't share URLs to resources
    - URL doesn't identify the resource
 
+   The /api/items routes take it from the URL, and a create without an
+   "id" gets the next number.
+
 8. NO HTTP STATUS SEMANTICS:
    REST conventions:
    - 201 Created: Resource successfully created
@@ -80,8 +88,8 @@ Why this violates REST principles:
    - 404 Not Found: Resource doesn't exist
    - 409 Conflict: Resource already exists
 
-   This API: Everything returns 200 (except errors return 400/404)
-   Missing: 201 for creation, 204 for deletion
+   This API: Everything returned 200 (except errors return 400/404)
+   Missing: 201 for creation, 204 for deletion (both there now)
 
 9. SINGLE POINT OF FAILURE:
    One route handles everything
@@ -127,7 +135,7 @@ RESTful approach:
     Response: {"id": "1", "name": "item1"}
     Size: ~30 bytes
 
-This approach:
+The old approach:
     POST /api {"action": "create", "id": "1", "name": "item1"}
     Response: {"message": "created", "items": {entire database}}
     Size: 30 bytes + entire database size
@@ -169,6 +177,9 @@ def list_items():
     return jsonify({"items": items})
 
 Clear routes, semantic methods, proper status codes, resource-oriented.
+These routes exist now: GET/POST /api/items and GET/PUT/DELETE
+/api/items/<id>, with JSON going through orjson when it is installed and
+error bodies encoded once at import.
 
 Additional problems with this implementation:
 
@@ -185,13 +196,18 @@ Additional problems with this implementation:
    Single endpoint easily DDoS'd
    No throttling, no protection
 
-4. DEBUG MODE:
+4. DEBUG MODE (fixed - the debugger is off):
    app.run(debug=True) in production:
    - Exposes stack traces
    - Allows code execution via debugger
    - Security nightmare
 
-5. IN-MEMORY STORAGE:
+   app.run() is only for poking at it locally. To serve it, point a real
+   WSGI server at the module-level app, e.g. from the days/ directory:
+
+       gunicorn -w $(nproc) -k gthread --threads 8 days_013__permanent_rest_API:app
+
+5. IN-MEMORY STORAGE (fixed - SQLite, items.db in WAL mode):
    items = {}
    Lost on restart, no persistence
 
@@ -199,15 +215,15 @@ Additional problems with this implementation:
    API changes break all clients
    No /v1/, /v2/ versioning
 
-7. NO PAGINATION:
-   "list" action returns everything
+7. NO PAGINATION (fixed - "offset"/"limit", LIMIT/OFFSET in SQL):
+   "list" action returned everything
    Imagine 1 million items
 
 8. GLOBAL MUTABLE STATE:
    All users share one dict
    No isolation, no multi-tenancy
 
-9. NOT THREAD-SAFE:
+9. NOT THREAD-SAFE (fixed - a lock guards the shared connection):
    Concurrent modifications to items dict
    Race conditions possible
 
@@ -248,82 +264,226 @@ Author's note: Flask supports multiple routes and methods natively.
                 Roy Fielding is having an aneurysm.
 """
 
-from flask import Flask, request, jsonify
+import hashlib
+import sqlite3
+import threading
+from itertools import count
+
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional: without orjson Flask's stdlib-json provider stays
+    orjson = None
 
 app = Flask(__name__)
 
-# In-memory demo data (lost on restart, no persistence)
-items = {}
 
+if orjson is not None:
+    class ORJSONProvider(JSONProvider):
+        """jsonify() and request.get_json() through orjson's C encoder/decoder."""
 
-def handle_create(data):
-    """
-    Create handler - should be POST /api/items
-    Instead: POST /api with action="create"
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
 
-    Returns entire items dict after creation (data leak)
-    """
-    item_id = data.get("id")
-    name = data.get("name")
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
+# Error bodies never change, so they are encoded once here; a failing
+# request just wraps the bytes in a fresh Response
+_ERR_INVALID_JSON = app.json.dumps({"error": "invalid json"}).encode()
+_ERR_UNKNOWN_ACTION = app.json.dumps({"error": "unknown action"}).encode()
+_ERR_NOT_FOUND = app.json.dumps({"error": "item not found"}).encode()
+_ERR_NAME_REQUIRED = app.json.dumps({"error": "name required"}).encode()
+_ERR_BAD_PAGE = app.json.dumps({"error": "offset and limit must be non-negative integers"}).encode()
+_ERR_BAD_ID = app.json.dumps({"error": "id must be a string or integer"}).encode()
+_ERR_BAD_NAME = app.json.dumps({"error": "name must be a string"}).encode()
+
+# The items live in SQLite, same WAL setup as the PickleDatabase port
+ITEMS_DATABASE_FILE = "items.db"
+
+# One connection per process, shared by every request thread. isolation_level
+# None means autocommit: each statement is its own transaction.
+_conn = sqlite3.connect(
+    ITEMS_DATABASE_FILE, timeout=30.0, check_same_thread=False, isolation_level=None
+)
+_conn.execute("PRAGMA journal_mode=WAL")
+_conn.execute("PRAGMA synchronous=NORMAL")
+_conn.execute("CREATE TABLE IF NOT EXISTS items (id TEXT PRIMARY KEY, name TEXT)")
 
-    if not item_id or not name:
-        return {"error": "id and name required"}, 400
+# Every use of the shared connection holds this, so threaded workers can't
+# interleave statements on it. It is per process: generated ids rely on
+# the primary key, not the lock, to stay unique across worker processes
+_lock = threading.Lock()
 
-    # No check if item already exists (should return 409 Conflict)
-    items[item_id] = name
+# Ids for creates that don't bring their own, continuing after the biggest
+# numeric id already stored; next() on a count is atomic
+_id_gen = count(
+    _conn.execute("SELECT COALESCE(MAX(CAST(id AS INTEGER)), 0) FROM items").fetchone()[0] + 1
+)
 
-    # Returns entire database state (scales poorly)
-    return {"message": "created", "items": items}, 200
+# "list" page size when the body doesn't ask, and the most it may ask for
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
 
+# Seconds a client or proxy may reuse a GET response before revalidating
+CACHE_MAX_AGE = 60
 
-def handle_update(data):
+
+def _bad_id(value):
+    # Ids are strings or ints (not bools); None means "not given". Anything
+    # else from a JSON body can't be bound as a SQLite parameter.
+    return value is not None and type(value) is not str and type(value) is not int
+
+
+def handle_create(item_id, name):
+    """
+    Create handler - should be POST /api/items
+    Instead: POST /api with action="create"
+
+    Returns just the created item (it used to return the entire items dict)
+
+    Without an "id" the item gets the next free numeric one.
+    """
+    if not name:
+        return _ERR_NAME_REQUIRED, 400
+    if type(name) is not str:
+        return _ERR_BAD_NAME, 400
+    if _bad_id(item_id):
+        return _ERR_BAD_ID, 400
+
+    with _lock:
+        if not item_id:
+            # Plain INSERT, so an id another worker process took first is
+            # a constraint error and we move on, instead of a replace
+            while True:
+                item_id = str(next(_id_gen))
+                try:
+                    _conn.execute("INSERT INTO items VALUES (?, ?)", (item_id, name))
+                    break
+                except sqlite3.IntegrityError:
+                    continue
+        else:
+            # No check if item already exists (should return 409 Conflict)
+            _conn.execute("INSERT OR REPLACE INTO items VALUES (?, ?)", (item_id, name))
+
+    return {"id": item_id, "name": name}, 201
+
+
+def handle_update(item_id, name):
     """
     Update handler - should be PUT /api/items/{id}
     Instead: POST /api with action="update"
 
-    Returns entire items dict after update (unnecessary)
+    Returns just the updated item
     """
-    item_id = data.get("id")
-    name = data.get("name")
+    if _bad_id(item_id):
+        return _ERR_BAD_ID, 400
+    if name is not None and type(name) is not str:
+        return _ERR_BAD_NAME, 400
 
-    if item_id not in items:
-        return {"error": "item not found"}, 404
-
-    items[item_id] = name
+    with _lock:
+        updated = _conn.execute(
+            "UPDATE items SET name = ? WHERE id = ?", (name, item_id)
+        ).rowcount
+    if not updated:
+        return _ERR_NOT_FOUND, 404
 
-    # Again, returns entire database
-    return {"message": "updated", "items": items}, 200
+    return {"id": item_id, "name": name}, 200
 
 
-def handle_delete(data):
+def handle_delete(item_id):
     """
     Delete handler - should be DELETE /api/items/{id}
     Instead: POST /api with action="delete"
 
-    Returns entire remaining items (why?)
+    Returns 204 and no body (it used to return every remaining item)
     """
-    item_id = data.get("id")
-
-    if item_id not in items:
-        return {"error": "item not found"}, 404
+    if _bad_id(item_id):
+        return _ERR_BAD_ID, 400
 
-    del items[item_id]
+    with _lock:
+        deleted = _conn.execute("DELETE FROM items WHERE id = ?", (item_id,)).rowcount
+    if not deleted:
+        return _ERR_NOT_FOUND, 404
 
-    # Returning all remaining items after deletion.... crazy right?
-    return {"message": "deleted", "items": items}, 200
+    return "", 204
 
 
-def handle_list(data):
+def handle_list(offset, limit):
     """
     List handler - should be GET /api/items
     Instead: POST /api with action="list"
 
-    At least this one returning everything makes sense.
-    But it's a POST request for a read operation (not cacheable).
+    Returns one page: "offset" (default 0) and "limit" (default
+    DEFAULT_PAGE_SIZE, capped at MAX_PAGE_SIZE) come from the body;
+    None means "not given".
+    Still a POST request for a read operation (not cacheable).
+    """
+    if offset is None:
+        offset = 0
+    if limit is None:
+        limit = DEFAULT_PAGE_SIZE
+    if type(offset) is not int or type(limit) is not int or offset < 0 or limit < 0:
+        return _ERR_BAD_PAGE, 400
+    limit = min(limit, MAX_PAGE_SIZE)
+
+    with _lock:
+        page = dict(_conn.execute(
+            "SELECT id, name FROM items ORDER BY rowid LIMIT ? OFFSET ?", (limit, offset)
+        ))
+        total = _conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+    return {"items": page, "offset": offset, "limit": limit, "total": total}, 200
+
+
+def handle_read(item_id):
+    """
+    Read handler - GET /api/items/{id}, or POST /api with action="read"
     """
-    # data parameter unused but kept for consistent handler signature, yes... I told it to shut up.
-    _ = data
-    return {"items": items}, 200
+    if _bad_id(item_id):
+        return _ERR_BAD_ID, 400
+
+    with _lock:
+        row = _conn.execute("SELECT name FROM items WHERE id = ?", (item_id,)).fetchone()
+    if row is None:
+        return _ERR_NOT_FOUND, 404
+    name = row[0]
+
+    return {"id": item_id, "name": name}, 200
+
+
+# action -> (handler, body fields it takes as positional arguments). One
+# hashed lookup instead of an if/elif string ladder, and the router reads
+# only the fields that handler needs, once.
+_HANDLERS = {
+    "create": (handle_create, ("id", "name")),
+    "update": (handle_update, ("id", "name")),
+    "delete": (handle_delete, ("id",)),
+    "list": (handle_list, ("offset", "limit")),
+    "read": (handle_read, ("id",)),
+}
+
+
+def _respond(response, status):
+    if status == 204:
+        return "", 204
+    if type(response) is bytes:  # one of the pre-encoded _ERR_* bodies
+        return Response(response, status, mimetype="application/json")
+    return jsonify(response), status
+
+
+def _respond_cacheable(response, status):
+    # GETs carry an ETag (blake2b of the encoded body) and a max-age, and
+    # make_conditional turns a matching If-None-Match into a bodiless 304
+    if status != 200:
+        return _respond(response, status)
+    resp = jsonify(response)
+    resp.set_etag(hashlib.blake2b(resp.get_data(), digest_size=8).hexdigest())
+    resp.cache_control.max_age = CACHE_MAX_AGE
+    return resp.make_conditional(request)
 
 
 # Single POST endpoint (ignoring HTTP method semantics)
@@ -362,32 +522,70 @@ def api_router():
 
     Notice: Every curl uses -X POST. The operation is in the data.
     This is what we're trying to avoid with REST.
+
+    Deprecated: kept for old clients. Use the /api/items routes below,
+    whose GETs can be cached.
     """
-    body = request.get_json()
+    # silent: malformed JSON comes back as None instead of raising
+    body = request.get_json(cache=True, silent=True)
 
-    if not body:
-        return jsonify({"error": "invalid json"}), 400
+    if not body or not isinstance(body, dict):
+        return Response(_ERR_INVALID_JSON, 400, mimetype="application/json")
 
-    # String comparison dispatch (poor man's routing)
+    # Dict dispatch (poor man's routing, now with hashing). Only strings are
+    # looked up: a list or object "action" would be unhashable
     action = body.get("action")
+    entry = _HANDLERS.get(action) if isinstance(action, str) else None
+    if entry is None:
+        return Response(_ERR_UNKNOWN_ACTION, 400, mimetype="application/json")
 
-    if action == "create":
-        response, status = handle_create(body)
-    elif action == "update":
-        response, status = handle_update(body)
-    elif action == "delete":
-        response, status = handle_delete(body)
-    elif action == "list":
-        response, status = handle_list(body)
-    else:
-        response, status = {"error": "unknown action"}, 400
-
-    return jsonify(response), status
+    handler, fields = entry
+    resp = app.make_response(_respond(*handler(*map(body.get, fields))))
+    resp.headers["Deprecation"] = "true"
+    return resp
 
 #why am I here? Just to suffer?......
 
 
+# The resource routes the docstring kept asking for
+
+@app.get("/api/items")
+def list_items():
+    # absent -> None (default); present but not an int -> -1, which fails
+    # handle_list's validation with a 400 instead of being silently ignored
+    args = request.args
+    offset, limit = (args.get(key, -1, type=int) if key in args else None
+                     for key in ("offset", "limit"))
+    return _respond_cacheable(*handle_list(offset, limit))
+
+
+@app.get("/api/items/<item_id>")
+def read_item(item_id):
+    return _respond_cacheable(*handle_read(item_id))
+
+
+@app.post("/api/items")
+def create_item():
+    body = request.get_json(cache=True, silent=True)
+    if not isinstance(body, dict):
+        return Response(_ERR_INVALID_JSON, 400, mimetype="application/json")
+    return _respond(*handle_create(body.get("id"), body.get("name")))
+
+
+@app.put("/api/items/<item_id>")
+def update_item(item_id):
+    body = request.get_json(cache=True, silent=True)
+    if not isinstance(body, dict):
+        return Response(_ERR_INVALID_JSON, 400, mimetype="application/json")
+    return _respond(*handle_update(item_id, body.get("name")))
+
+
+@app.delete("/api/items/<item_id>")
+def delete_item(item_id):
+    return _respond(*handle_delete(item_id))
+
+
 if __name__ == "__main__":
-    # debug=True exposes stack traces and debug console
-    # Never use in production
-    app.run(debug=True)
\ No newline at end of file
+    # Werkzeug's dev server, threaded, no debugger or reloader.
+    # Production goes through gunicorn (see the module docstring).
+    app.run(threaded=True)
\ No newline at end of file
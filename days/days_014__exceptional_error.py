@@ -1,12 +1,13 @@
 """
 EXCEPTION-DRIVEN CONTROL FLOW - RAISING YOUR WAY TO SUCCESS
 
-WARNING: This code uses exceptions for normal program logic, not errors.
+WARNING: This code used exceptions for normal program logic, not errors.
 
-What this does:
-Uses try-except blocks and raising exceptions for control flow instead of
-simple if-else statements. Exceptions become the primary way the program
-makes decisions.
+What this did:
+Used try-except blocks and raising exceptions for control flow instead of
+simple if-else statements. Exceptions became the primary way the program
+made decisions. The checks are if statements in parse_age() now, and
+read_age() and friends only wrap it with input() and print().
 
 The correct way:
     def read_age():
@@ -261,7 +262,7 @@ Reading this: "Try doing this, if it raises this specific error
               with this specific message, do that, unless it's
               a different error, then..."
 
-Exception anti-patterns in this code:
+Exception anti-patterns this code used to have (all four are gone):
 
 1. Empty check via exception:
    try:
@@ -299,126 +300,159 @@ Author's note: I could have used if-else statements.
                 Guido van Rossum is weeping.
 """
 
+from array import array
+from functools import lru_cache
 
-def read_age():
+
+def _is_int_text(text):
     """
-    Read age using exceptions for control flow instead of normal conditionals.
+    True when int(text) will parse: optional sign, decimal digits, and
+    surrounding whitespace - checked without raising anything.
+    """
+    digits = text.strip()
+    if digits[:1] in ("+", "-"):
+        digits = digits[1:]
+    # int() refuses strings longer than this by default
+    return digits.isdecimal() and len(digits) <= 4300
 
-    Wraps every validation check in try-except blocks.
-    Raises exceptions for conditions that should be simple if statements.
-    Nests try-except blocks four levels deep.
 
-    Time Complexity: O(number of exceptions raised)
-    Readability Complexity: O(please make it stop)
+# Every canonical integer string a batch is likely to contain, mapped to
+# its age (or -1 when it's out of range). Built once at import; anything
+# not in here (whitespace, signs, leading zeros) takes the slow path.
+_AGE_OF_TEXT = {str(n): (n if 0 <= n <= 150 else -1) for n in range(-99, 1000)}
 
-    This is what happens when you learn about try-except
-    and decide it should replace all your if statements.
-    """
-    # Using exception as control flow for empty check
-    # Should be: if not text: return None
-    try:
-        text = input("Enter your age: ")
-        if text == "":
-            raise ValueError("empty")
-    except ValueError:
-        print("Empty input!")
-        return None
 
-    # Using exception to check if it's a number
-    # At least this use of try-except makes sense
-    try:
-        age = int(text)
+@lru_cache(maxsize=None)
+def make_range_validator(lo, hi, label="range"):
+    """
+    Build a function returning x when lo <= x <= hi, and None otherwise.
 
-        # Using exception for range validation (should be if statement)
-        try:
-            if age < 0:
-                raise ValueError("negative")
-        except ValueError:
-            print("Age cannot be negative!")
-            return None
+    The bounds are written into generated source as literals, so the
+    compiled validator compares against constants instead of looking up
+    globals or closure cells. One validator is built per (lo, hi, label).
+    """
+    source = (f"def validate(x):\n"
+              f"    if x < {int(lo)!r} or x > {int(hi)!r}:\n"
+              f"        return None\n"
+              f"    return x\n")
+    namespace = {}
+    exec(compile(source, f"<{label} validator>", "exec"), namespace)
+    return namespace["validate"]
 
-        # Using exception for upper bound (another unnecessary try-except)
-        try:
-            if age > 150:
-                raise ValueError("too_old")
-        except ValueError:
-            print("That's too old!")
-            return None
 
-        # If we made it here, age is valid
-        return age
+validate_age = make_range_validator(0, 150, "age")
 
-    except ValueError:
-        # This catches the int() conversion failure
-        # This is actually appropriate exception handling!
-        print("Not a number!")
-        return None
 
+def parse_age(text):
+    """
+    Validate one age string without any I/O.
 
-def read_age_even_worse():
+    Returns:
+        (age, None) for a valid age, or (None, reason) where reason is
+        the message the interactive readers print
     """
-    The nuclear option: using exception messages for control flow.
+    if not text:
+        return None, "Empty input!"
+    if not _is_int_text(text):
+        return None, "Not a number!"
+    age = int(text)
+    if age < 0:
+        return None, "Age cannot be negative!"
+    if age > 150:
+        return None, "That's too old!"
+    return age, None
+
 
-    Raises an exception on SUCCESS and checks the message to decide what to do.
-    This is the final boss of exception abuse.
+def read_age():
     """
-    user_age = None
+    Read age the way that used to use exceptions for control flow.
 
-    try:
-        text = input("Enter your age: ")
-        user_age = int(text)
+    This used to wrap every validation check in try-except blocks,
+    raising exceptions for conditions that should be simple if statements,
+    nested four levels deep. Each "check" raised and caught a ValueError
+    in the same frame.
 
-        # RAISING EXCEPTION ON SUCCESS
-        # This is it. This is the worst thing. WHY?
-        if user_age >= 0 and user_age <= 150:
-            raise ValueError("success")
-        else:
-            raise ValueError("invalid_range")
-
-    except ValueError as e:
-        # Control flow based on exception message
-        # Exception messages are for humans, not control flow!
-        if str(e) == "success":
-            return user_age
-        elif str(e) == "invalid_range":
-            print("Age must be between 0 and 150!")
-            return None
-        else:
-            print("Invalid age!")
-            return None
+    Now the checks are plain if statements in parse_age(), and the text
+    is checked with _is_int_text() before int() sees it, so rejecting
+    garbage doesn't cost an exception either. This just reads the line
+    and prints the reason parse_age() gives back.
 
+    Time Complexity: O(1) - no exceptions raised for valid input
+    Readability Complexity: O(read it top to bottom)
+    """
+    age, reason = parse_age(input("Enter your age: "))
+    if reason is not None:
+        print(reason)
+    return age
 
-def read_age_correctly():
-    """The correct way to validate age input without exception abuse."""
-    text = input("Enter your age: ")
 
-    if not text:
-        print("Empty input!")
-        return None
+def read_age_even_worse():
+    """
+    The nuclear option that used to use exception messages for control flow.
+
+    It raised an exception on SUCCESS and checked str(e) to decide what to
+    do - the final boss of exception abuse. The valid path now just returns,
+    and the range check is one chained comparison.
+    """
+    text = input("Enter your age: ")
 
     try:
         user_age = int(text)
     except ValueError:
-        print("Not a number!")
+        print("Invalid age!")
         return None
 
-    if user_age < 0:
-        print("Age cannot be negative!")
-        return None
+    if 0 <= user_age <= 150:
+        return user_age
+    print("Age must be between 0 and 150!")
+    return None
 
-    if user_age > 150:
-        print("That's too old!")
-        return None
 
+def read_age_correctly():
+    """
+    The correct way to validate age input without exception abuse.
+
+    Validation lives in parse_age(), which does no I/O, so batch callers
+    can use it without paying for a print per rejected input.
+    """
+    user_age, reason = parse_age(input("Enter your age: "))
+    if reason is not None:
+        print(reason)
     return user_age
 
 
+def read_ages_batch(texts):
+    """
+    Validate many age strings at once, with no input(), print or exceptions.
+
+    Returns:
+        array("h") with one entry per text: the age, or -1 if the text
+        isn't an integer between 0 and 150
+
+    The common case - plain digits - is one dict lookup per text, run in
+    C by map(). Only texts the table doesn't know are parsed one by one.
+
+    There's deliberately no separate 0 <= age <= 150 pass over an int
+    array to hand to numba: the range check is folded into the table at
+    import, so no per-element compare is left to compile, and the misses
+    are strings, which a JIT wouldn't parse any faster than int().
+    """
+    ages = list(map(_AGE_OF_TEXT.get, texts))
+    if None in ages:
+        for idx, age in enumerate(ages):
+            if age is None:
+                text = texts[idx]
+                age = validate_age(int(text)) if _is_int_text(text) else None
+                ages[idx] = -1 if age is None else age
+    return array("h", ages)
+
+
 # Example usage
 if __name__ == "__main__":
     print("Exception-Driven Control Flow Demo")
     print("=" * 50)
 
-    print("\nVersion 1: Nested try-except hell")
+    print("\nVersion 1: Nested try-except hell (flattened into if statements)")
     age = read_age()
     if age is not None:
         print(f"Next year you will be: {age + 1}")
@@ -426,7 +460,7 @@ if __name__ == "__main__":
         print("Could not calculate next year age.")
 
     print("\n" + "=" * 50)
-    print("\nVersion 2: Exception for success (the final boss)")
+    print("\nVersion 2: Exception for success (the final boss, defeated)")
     age = read_age_even_worse()
     if age is not None:
         print(f"Next year you will be: {age + 1}")
@@ -439,4 +473,8 @@ if __name__ == "__main__":
     print("\nClear, readable, exceptions only for actual errors.")
     correct_age = read_age_correctly()
     if correct_age is not None:
-        print(f"Next year you will be: {correct_age + 1}")
\ No newline at end of file
+        print(f"Next year you will be: {correct_age + 1}")
+
+    print("\nValidating a whole batch (no input, no exceptions):")
+    batch = ["42", "-3", "abc", "", " 7 ", "200", "150"]
+    print(f"   {batch} -> {list(read_ages_batch(batch))}")
\ No newline at end of file
@@ -10,8 +10,9 @@ If you see encoding errors or weird characters:
 
 What this does:
 Uses emoji characters (🍎, 🍌, ➕, etc.) as variable names, function names,
-and class names. Python supports Unicode identifiers, so this is technically
-valid syntax that actually runs.
+and class names. Python supports Unicode identifiers, so this looks like
+technically valid syntax. It isn't: emoji are not identifier characters, so
+CPython stops at the first 🍎 with a SyntaxError and nothing here runs.
 
 The correct way:
     apple_count = 10
@@ -283,28 +284,18 @@ Author's note: I could have used descriptive variable names.
                 My future self hates me.
 """
 
-# Emoji variables (technically valid, practically terrible)
-🍎 = 10
-🍌 = 5
-➕ = 🍎 + 🍌
-print(➕)
-# embrace your inner facebook Mom
+from functools import partial
+from operator import add, sub, mul, truediv
 
-# Emoji as a counter (why would you do this?)
-🔢 = 0
-for _ in range(3):
-    🔢 += 1
-print("Counter:", 🔢)
-
-# Emoji storing a string (the semantics make no sense)
-👋 = "Hello, world!"
-print(👋)
 
 # Advanced emoji crimes
-def 🧮(🍎, 🍌):  # A for apple, B for Banana
+def 🧮(🍎: int, 🍌: int) -> int:  # A for apple, B for Banana
     """
     A function with emoji name and emoji parameters.
 
+    The annotations would let mypyc or Cython compile it, if either
+    could parse the name.
+
     How do you call this function?
     How do you document it?
     How do you debug it?
@@ -321,18 +312,31 @@ class 🐍:
 
     Inheriting from this: class 🦎(🐍):
     Good luck explaining that to your team.
+
+    Instances use slots instead of a __dict__. 📛 is read-only, which
+    is what lets 👋() hand back a greeting built once in __init__.
     """
 
-    def __init__(self, 📛):
+    __slots__ = ("_📛", "_greeting")
+
+    _📛: str
+    _greeting: str
+
+    def __init__(self, 📛: str) -> None:
         """
         Constructor with emoji parameter name.
 
         What does 📛 mean? Name tag emoji = name?
         You have to guess or read the code.
         """
-        self.📛 = 📛
+        self._📛 = 📛
+        self._greeting = f"Hello, I'm {📛}"
+
+    @property
+    def 📛(self) -> str:
+        return self._📛
 
-    def 👋(self):
+    def 👋(self) -> str:
         """
         Method named with wave emoji.
 
@@ -340,39 +344,51 @@ class 🐍:
         Documenting it: "Call the wave emoji method"
         Explaining it to your boss: Impossible
         """
-        return f"Hello, I'm {self.📛}"
+        return self._greeting
 
 
-# Using the emoji class (please don't)
-🐍_instance = 🐍("Python")
-print(🐍_instance.👋())
-
-# More emoji crimes
-🔢 = int  # Emoji as type alias
-📝 = str
-✅ = True
-❌ = False
-
 # Emoji operators (this is getting ridiculous)
-➕_func = lambda x, y: x + y
-➖_func = lambda x, y: x - y
-✖️ = lambda x, y: x * y
-➗ = lambda x, y: x / y
-
-# Using emoji operators
-result = ➕_func(🔢("5"), 🔢("3"))
-print("Result:", result)
-
-# Emoji conditionals (peak madness)
-if ✅:
-    print("This is true!")
-else:
-    print("This is false!")
+# (the operator module's C functions: no Python frame per call like a lambda)
+➕_func = add
+➖_func = sub
+✖️ = mul
+➗ = truediv
 
 
 # The comparison everyone wants to see
 # for some reason my aah could understand this code better
 if __name__ == "__main__":
+    # Emoji variables (technically valid, practically terrible)
+    🍎 = 10
+    🍌 = 5
+    ➕ = 🍎 + 🍌
+    print(➕)
+    # embrace your inner facebook Mom
+
+    # Emoji as a counter (why would you do this?) - it only ever counted to 3
+    🔢 = 3
+    print("Counter:", 🔢)
+
+    # Emoji storing a string (the semantics make no sense)
+    👋 = "Hello, world!"
+    print(👋)
+
+    # Using the emoji class (please don't)
+    🐍_instance = 🐍("Python")
+    print(🐍_instance.👋())
+
+    # Using emoji operators
+    result = ➕_func(int("5"), int("3"))
+    print("Result:", result)
+
+    # They're plain C functions, so map() takes them as-is (no wrapper
+    # lambda), and partial() fixes an argument without adding a frame
+    print("Sums:", list(map(➕_func, [1, 2, 3], [4, 5, 6])))
+    print("Doubled:", list(map(partial(✖️, 2), [1, 2, 3])))
+
+    # Emoji conditionals used to branch on ✅ = True; it was always true
+    print("This is true!")
+
     print("\n" + "=" * 50)
     print("Emoji Variables Demo")
     print("=" * 50)